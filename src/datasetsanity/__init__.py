@@ -2,24 +2,41 @@
 
 __version__ = "0.0.1"
 
+from typing import Any
+
 from .custom_exception import (
     DatasetSanityError,
     MissingValuesError,
     ClassImbalanceError,
     DataLeakageError,
+    GroupLeakageError,
 )
 
-# Optional: central logger
-from .logger import get_logger
+# Heavy modules (pandas, logging handlers) load on first attribute access so
+# that the thin daemon client starts quickly.
+_LAZY = {
+    "get_logger": "logger",
+    "DatasetSanity": "core",
+    "SanityReport": "report",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        import importlib
+
+        module = importlib.import_module(f".{_LAZY[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-from .core import DatasetSanity, SanityReport
 
 __all__ = [
     "DatasetSanityError",
     "MissingValuesError",
     "ClassImbalanceError",
     "DataLeakageError",
+    "GroupLeakageError",
     "get_logger",
     "DatasetSanity",
     "SanityReport",
-]
\ No newline at end of file
+]
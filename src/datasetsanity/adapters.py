@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from typing import Any, List, Union
+
+import numpy as np
+import pandas as pd
+
+
+def _is_arrow_table(obj: Any) -> bool:
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return False
+    return isinstance(obj, pa.Table)
+
+
+def _is_polars_frame(obj: Any) -> bool:
+    try:
+        import polars as pl
+    except ImportError:
+        return False
+    return isinstance(obj, pl.DataFrame)
+
+
+class ArrowFrame:
+    """
+    Read-only view of a pyarrow Table exposing what the validators need.
+
+    Null counts come from Arrow's validity metadata, numeric columns are
+    handed out as NumPy views of the Arrow buffers whenever the column is a
+    single null-free chunk, and nothing is ever converted to pandas.
+    """
+
+    def __init__(self, table: Any) -> None:
+        self.table = table
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self.table.column_names)
+
+    def __len__(self) -> int:
+        return int(self.table.num_rows)
+
+    def _null_count(self, column: str) -> int:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        chunked = self.table.column(column)
+        count = chunked.null_count
+        if pa.types.is_floating(chunked.type):
+            # pandas treats NaN as missing; Arrow only tracks nulls
+            count += int(pc.sum(pc.is_nan(chunked)).as_py() or 0)
+        return int(count)
+
+    def null_counts(self) -> pd.Series:
+        """
+        Missing values per column, read from each chunk's null_count.
+
+        Floating-point columns additionally count NaN, matching pandas.
+        """
+        return pd.Series(
+            [self._null_count(col) for col in self.columns],
+            index=self.columns,
+            dtype="int64",
+        )
+
+    def numeric_columns(self) -> List[str]:
+        """Integer and floating-point columns (booleans excluded, as in pandas)."""
+        import pyarrow as pa
+
+        return [
+            field.name
+            for field in self.table.schema
+            if pa.types.is_integer(field.type) or pa.types.is_floating(field.type)
+        ]
+
+    def to_numpy(self, column: str) -> np.ndarray:
+        """
+        Return ``column`` as a 1-D NumPy array with nulls as NaN.
+
+        Zero-copy for a single null-free chunk; otherwise the chunks are
+        copied once into a float64 array.
+        """
+        chunked = self.table.column(column)
+        if chunked.num_chunks == 1 and chunked.null_count == 0:
+            return np.asarray(chunked.chunk(0).to_numpy(zero_copy_only=True))
+        if chunked.num_chunks == 0:
+            return np.empty(0, dtype=float)
+        return np.concatenate(
+            [chunk.to_numpy(zero_copy_only=False).astype(float, copy=False) for chunk in chunked.chunks]
+        )
+
+    def class_ratios(self, column: str) -> pd.Series:
+        """Relative frequency of each non-null value, like ``value_counts(normalize=True)``."""
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        values = self.table.column(column).drop_null()
+        if pa.types.is_floating(values.type):
+            values = values.filter(pc.invert(pc.is_nan(values)))
+        counts = pc.value_counts(values)
+        values = counts.field("values").to_pylist()
+        totals = np.asarray(counts.field("counts").to_numpy(), dtype=float)
+        if not len(totals):
+            return pd.Series([], dtype=float)
+        return pd.Series(totals / totals.sum(), index=values).sort_values(ascending=False)
+
+
+Frame = Union[pd.DataFrame, ArrowFrame]
+
+
+def as_frame(obj: Any) -> Frame:
+    """
+    Return a pandas DataFrame unchanged, or wrap a pyarrow Table / Polars
+    DataFrame in an ``ArrowFrame`` without converting it to pandas.
+    """
+    if isinstance(obj, (pd.DataFrame, ArrowFrame)):
+        return obj
+    if _is_arrow_table(obj):
+        return ArrowFrame(obj)
+    if _is_polars_frame(obj):
+        # Polars shares its Arrow buffers with the exported table.
+        return ArrowFrame(obj.to_arrow())
+    raise TypeError(f"Unsupported dataset type: {type(obj).__name__}")
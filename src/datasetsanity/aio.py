@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+from concurrent.futures import Executor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+import pandas as pd
+
+from datasetsanity.core import DatasetSanity
+from datasetsanity.logger import get_logger
+from datasetsanity.report import SanityReport
+from datasetsanity.validators import StreamingScan
+
+logger = get_logger(__name__)
+
+Dataset = Union[str, pd.DataFrame]
+
+
+def _next_chunk(reader: Iterator[pd.DataFrame]) -> Optional[pd.DataFrame]:
+    return next(reader, None)
+
+
+async def acheck_csv(
+    path: str,
+    target: Union[str, Sequence[str]],
+    task: str = "classification",
+    imbalance_threshold: float = 0.9,
+    correlation_threshold: float = 0.95,
+    chunk_rows: int = 100_000,
+    executor: Optional[Executor] = None,
+) -> SanityReport:
+    """
+    Check a CSV file, overlapping the read of each chunk with the
+    statistics of the previous one.
+
+    Reads and computations both run in ``executor`` (threads; the default is
+    the loop's executor) and are applied in file order, so the report equals
+    ``DatasetSanity(pd.read_csv(path), ...).run()``. If the chunks disagree on
+    column types the file is re-read whole and checked synchronously.
+    """
+    loop = asyncio.get_running_loop()
+    options: Dict[str, Any] = {
+        "target": target,
+        "task": task,
+        "imbalance_threshold": imbalance_threshold,
+        "correlation_threshold": correlation_threshold,
+    }
+    targets = [target] if isinstance(target, str) else list(target)
+    scan = StreamingScan(targets, count_classes=task == "classification")
+
+    reader = await loop.run_in_executor(executor, functools.partial(pd.read_csv, path, chunksize=chunk_rows))
+    header: Optional[pd.DataFrame] = None
+    try:
+        with reader:
+            pending_read = loop.run_in_executor(executor, _next_chunk, reader)
+            pending_update: Optional[asyncio.Future[None]] = None
+            try:
+                while True:
+                    chunk = await pending_read
+                    if chunk is None:
+                        break
+                    # start reading chunk k+1 while chunk k is being scanned
+                    pending_read = loop.run_in_executor(executor, _next_chunk, reader)
+                    if pending_update is not None:
+                        await pending_update
+                    if header is None:
+                        header = chunk.iloc[:0]
+                    pending_update = loop.run_in_executor(executor, scan.update, chunk)
+                if pending_update is not None:
+                    await pending_update
+            finally:
+                # never close the reader under an in-flight read
+                await asyncio.gather(pending_read, return_exceptions=True)
+    except (TypeError, ValueError) as exc:
+        if scan.columns is None:
+            raise
+        logger.info("Chunked scan of %s failed (%s); checking the whole file", path, exc)
+        df = await loop.run_in_executor(executor, pd.read_csv, path)
+        return await DatasetSanity(df, **options).arun(executor)
+
+    if header is None:
+        header = await loop.run_in_executor(executor, pd.read_csv, path)
+    checker = DatasetSanity(header, **options)
+    return checker.report_from_stats(scan.null_counts(), scan.correlations(), ratios=scan.ratios())
+
+
+async def acheck_many(
+    datasets: Iterable[Dataset],
+    target: Union[str, Sequence[str]],
+    task: str = "classification",
+    imbalance_threshold: float = 0.9,
+    correlation_threshold: float = 0.95,
+    chunk_rows: int = 100_000,
+    max_in_flight: int = 4,
+    executor: Optional[Executor] = None,
+) -> List[SanityReport]:
+    """
+    Check many datasets concurrently, with at most ``max_in_flight`` at once.
+
+    ``datasets`` holds CSV paths (streamed with ``acheck_csv``) and/or
+    DataFrames (checked with ``DatasetSanity.arun``; ``chunk_rows`` does not
+    apply). Returns one report per dataset, in input order, so a path listed
+    twice gets two reports.
+    """
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1")
+    semaphore = asyncio.Semaphore(max_in_flight)
+    options: Dict[str, Any] = {
+        "task": task,
+        "imbalance_threshold": imbalance_threshold,
+        "correlation_threshold": correlation_threshold,
+    }
+
+    async def check_one(dataset: Dataset) -> SanityReport:
+        async with semaphore:
+            if isinstance(dataset, str):
+                return await acheck_csv(dataset, target, chunk_rows=chunk_rows, executor=executor, **options)
+            return await DatasetSanity(dataset, target=target, **options).arun(executor)
+
+    return list(await asyncio.gather(*(check_one(item) for item in datasets)))
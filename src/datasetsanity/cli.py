@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import sys
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import click
-import pandas as pd
 
-from datasetsanity.core import DatasetSanity
+from datasetsanity.client import DEFAULT_ADDRESS, parse_address
+
+# pandas and the checking machinery are imported inside the commands so that
+# ``check --server`` stays a thin client.
 
 
 @click.group()
@@ -15,7 +18,7 @@ def main() -> None:
 
 @main.command()
 @click.argument("csv_file")
-@click.option("--target", required=True, help="Name of the target column.")
+@click.option("--target", "targets", required=True, multiple=True, help="Name of the target column (repeat for several targets).")
 @click.option(
     "--task",
     default="classification",
@@ -24,21 +27,117 @@ def main() -> None:
     help="ML task type.",
 )
 @click.option("--output", default=None, help="Optional path to write the JSON report.")
-def check(csv_file: str, target: str, task: str, output: str) -> None:
+@click.option(
+    "--columns",
+    "feature_columns",
+    multiple=True,
+    help="Only check these feature columns (repeatable); other columns are not parsed.",
+)
+@click.option("--segment-by", "segment_by", multiple=True, help="Also check each segment of this column (repeatable).")
+@click.option("--group-by", "group_by", multiple=True, help="Entity key column to check across splits (repeatable).")
+@click.option("--split-column", default=None, help="Column holding the train/validation/test split (used with --group-by).")
+@click.option("--fail-fast", is_flag=True, help="Stop at the first certain failure.")
+@click.option("--deadline", type=float, default=None, help="Time budget in seconds; unfinished checks are estimated or not reached.")
+@click.option("--server", default=None, help="Send the check to a running `datasetsanity serve` at this address.")
+def check(
+    csv_file: str,
+    targets: Tuple[str, ...],
+    task: str,
+    output: str,
+    feature_columns: Tuple[str, ...],
+    segment_by: Tuple[str, ...],
+    group_by: Tuple[str, ...],
+    split_column: Optional[str],
+    fail_fast: bool,
+    deadline: Optional[float],
+    server: Optional[str],
+) -> None:
     """Run sanity checks on CSV_FILE."""
-    df = pd.read_csv(csv_file)
-    checker = DatasetSanity(df, target=target, task=task)
-    report = checker.run()
+    target: Union[str, List[str]] = targets[0] if len(targets) == 1 else list(targets)
+    if group_by and not split_column:
+        raise click.UsageError("--group-by requires --split-column")
+    if server and feature_columns:
+        raise click.UsageError("--columns cannot be combined with --server")
+
+    if server:
+        import os
+
+        from datasetsanity.client import send_request
+        from datasetsanity.report import SanityReport
+
+        payload: Dict[str, Any] = {
+            "path": os.path.abspath(csv_file),
+            "target": target,
+            "task": task,
+            "segment_by": list(segment_by),
+            "group_by": list(group_by),
+            "split_column": split_column,
+            "fail_fast": fail_fast,
+            "deadline": deadline,
+        }
+        try:
+            reply = send_request(server, payload)
+        except ValueError as exc:
+            raise click.UsageError(str(exc))
+        except OSError as exc:
+            raise click.ClickException(f"cannot reach server at {server}: {exc}")
+        if not reply.get("ok"):
+            raise click.ClickException(reply.get("error", "server error"))
+        report = SanityReport.from_dict(reply["report"])
+    else:
+        import pandas as pd
+
+        from datasetsanity.core import DatasetSanity
+        from datasetsanity.ingest import read_csv_fast
+
+        keys = [*segment_by, *group_by, *([split_column] if split_column else [])]
+        usecols = [*feature_columns, *targets, *keys] if feature_columns else None
+        try:
+            df, stats = read_csv_fast(csv_file, usecols=usecols, keep_dtypes=keys)
+        except pd.errors.ParserError:
+            raise
+        except ValueError as exc:
+            # unknown --columns / --target / key columns
+            raise click.UsageError(str(exc))
+        saved = max(stats["default_bytes"] - stats["bytes"], 0)
+        click.echo(
+            f"Parsed {stats['rows']} rows x {stats['columns']} columns in {stats['seconds']:.2f}s "
+            f"({stats['engine']} engine): {stats['bytes'] / 1e6:.1f} MB, "
+            f"~{saved / 1e6:.1f} MB saved vs default read"
+        )
+        checker = DatasetSanity(
+            df,
+            target=target,
+            task=task,
+            segment_by=list(segment_by),
+            group_by=list(group_by),
+            split_column=split_column,
+        )
+        report = checker.run(fail_fast=fail_fast, deadline=deadline)
+
     report.summary()
 
     if output:
         report.to_json(output)
         click.echo(f"Report written to {output}")
 
-    all_passed = (
-        report.missing_values.passed
-        and report.class_imbalance.passed
-        and report.leakage.passed
-    )
-    if not all_passed:
+    if not report.passed:
         sys.exit(1)
+
+
+@main.command()
+@click.option("--address", default=DEFAULT_ADDRESS, show_default=True, help="host:port or Unix socket path (containing '/') to listen on.")
+@click.option("--cache-size", default=8, show_default=True, type=click.IntRange(min=1), help="Number of datasets kept in memory.")
+def serve(address: str, cache_size: int) -> None:
+    """Keep a warm checker process running for `check --server`."""
+    from datasetsanity.server import serve as run_server
+
+    try:
+        parse_address(address)
+    except ValueError as exc:
+        raise click.UsageError(str(exc))
+    click.echo(f"Listening on {address}")
+    try:
+        run_server(address, cache_size=cache_size)
+    except FileExistsError as exc:
+        raise click.UsageError(str(exc))
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import json
+import socket
+from typing import Any, Dict, Optional, Tuple
+
+# Kept free of pandas/numpy imports so that talking to a running
+# ``datasetsanity serve`` process costs only interpreter startup.
+
+DEFAULT_ADDRESS = "127.0.0.1:8765"
+
+
+def parse_address(address: str) -> Tuple[int, Any]:
+    """
+    Return ``(socket_family, address)`` for ``"host:port"`` or a Unix socket path.
+
+    Socket paths must contain a ``/`` (e.g. ``./ds.sock``) so that a mistyped
+    host such as ``localhost`` is rejected instead of creating a file.
+    """
+    host, sep, port = address.rpartition(":")
+    if sep and port.isdigit() and "/" not in address:
+        return socket.AF_INET, (host or "127.0.0.1", int(port))
+    if "/" not in address:
+        raise ValueError(f"Expected host:port or a socket path containing '/': {address}")
+    if not hasattr(socket, "AF_UNIX"):
+        raise ValueError(f"Unix sockets are not supported on this platform: {address}")
+    return socket.AF_UNIX, address
+
+
+def send_request(
+    address: str,
+    payload: Dict[str, Any],
+    timeout: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Send one JSON request to a DatasetSanity server and return its JSON reply."""
+    family, addr = parse_address(address)
+    with socket.socket(family, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(addr)
+        sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as reply:
+            line = reply.readline()
+    if not line:
+        raise ConnectionError(f"No reply from DatasetSanity server at {address}")
+    result: Dict[str, Any] = json.loads(line)
+    return result
@@ -1,172 +1,475 @@
 from __future__ import annotations
 
-import json
-from typing import Any, Dict
+import asyncio
+import functools
+import time
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
+from datasetsanity.adapters import Frame, as_frame
 from datasetsanity.custom_exception import (
     ClassImbalanceError,
     DataLeakageError,
     DatasetSanityError,
+    GroupLeakageError,
     MissingValuesError,
 )
 from datasetsanity.logger import get_logger
+from datasetsanity.report import COMPLETED, ESTIMATED, NOT_REACHED, CheckResult, SanityReport, TargetResult
+from datasetsanity.sparse import from_scipy_sparse, is_scipy_sparse
 from datasetsanity.validators import (
+    CorrelationAccumulator,
     check_class_imbalance,
     check_data_leakage,
+    check_group_leakage,
     check_missing_values,
+    missing_value_counts,
+    scan_dataset,
+    segment_scan,
 )
 
 logger = get_logger(__name__)
 
-_PASS = "\u2714"
-_WARN = "\u26a0"
-_FAIL = "\u274c"
 
+class DatasetSanity:
+    """Orchestrates all dataset sanity checks.
 
-class CheckResult:
-    """Stores the outcome of a single sanity check."""
-
-    def __init__(self, passed: bool, details: Dict[str, Any]) -> None:
-        self.passed = passed
-        self.details = details
+    ``target`` may be a single column name or a list of candidate target
+    columns. With several targets the missing-value scan and the correlation
+    matrix are computed once and shared by every per-target section.
 
+    ``df`` may also be a scipy.sparse matrix, in which case ``columns`` names
+    its columns and the checks run on the sparse structure directly, or a
+    pyarrow Table / Polars DataFrame, which is checked without converting to
+    pandas.
 
-class SanityReport:
-    """Aggregates the results of all three DatasetSanity checks."""
+    ``segment_by`` names one or more columns; every check is then also
+    evaluated per segment from one grouped pass (pandas input only).
 
-    def __init__(
-        self,
-        missing_values: CheckResult,
-        class_imbalance: CheckResult,
-        leakage: CheckResult,
-    ) -> None:
-        self.missing_values = missing_values
-        self.class_imbalance = class_imbalance
-        self.leakage = leakage
-
-    def _symbol(self, passed: bool) -> str:
-        return _PASS if passed else _FAIL
-
-    def summary(self) -> None:
-        """Print a human-readable console report."""
-        print("DatasetSanity Report")
-        print("=" * 40)
-
-        for name, result in [
-            ("Missing Values", self.missing_values),
-            ("Class Imbalance", self.class_imbalance),
-            ("Data Leakage", self.leakage),
-        ]:
-            symbol = self._symbol(result.passed)
-            status = "PASSED" if result.passed else "FAILED"
-            print(f"  {symbol}  {name}: {status}")
-            if result.details:
-                for key, value in result.details.items():
-                    print(f"       {key}: {value}")
-
-        print("=" * 40)
-        overall = self.missing_values.passed and self.class_imbalance.passed and self.leakage.passed
-        overall_symbol = _PASS if overall else _WARN
-        overall_status = "All checks passed" if overall else "Some checks failed"
-        print(f"  {overall_symbol}  Overall: {overall_status}")
-
-    def to_json(self, path: str) -> None:
-        """Write the report results to a JSON file."""
-        data = {
-            "missing_values": {
-                "passed": self.missing_values.passed,
-                "details": self.missing_values.details,
-            },
-            "class_imbalance": {
-                "passed": self.class_imbalance.passed,
-                "details": self.class_imbalance.details,
-            },
-            "leakage": {
-                "passed": self.leakage.passed,
-                "details": self.leakage.details,
-            },
-        }
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2)
-        logger.info("Report written to %s", path)
-
-
-class DatasetSanity:
-    """Orchestrates all dataset sanity checks."""
+    ``group_by`` names entity key columns (e.g. a customer id) and
+    ``split_column`` the train/validation/test assignment; the report then
+    also flags entities shared between splits (pandas input only).
+    """
 
     def __init__(
         self,
-        df: pd.DataFrame,
-        target: str,
+        df: Any,
+        target: Union[str, Sequence[str]],
         task: str = "classification",
         imbalance_threshold: float = 0.9,
         correlation_threshold: float = 0.95,
+        columns: Optional[Sequence[str]] = None,
+        segment_by: Optional[Union[str, Sequence[str]]] = None,
+        group_by: Optional[Union[str, Sequence[str]]] = None,
+        split_column: Optional[str] = None,
+        max_group_overlap: float = 0.0,
     ) -> None:
-        self.df = df
+        if is_scipy_sparse(df):
+            df = from_scipy_sparse(df, columns=columns)
+        self.df: Frame = as_frame(df)
         self.target = target
+        if not self.targets:
+            raise ValueError("target must name at least one column")
+        if len(set(self.targets)) != len(self.targets):
+            raise ValueError(f"Duplicate target columns: {', '.join(self.targets)}")
         self.task = task
         self.imbalance_threshold = imbalance_threshold
         self.correlation_threshold = correlation_threshold
+        self.segment_by: List[str] = [segment_by] if isinstance(segment_by, str) else list(segment_by or [])
+        if self.segment_by and not isinstance(self.df, pd.DataFrame):
+            raise TypeError("segment_by requires a pandas DataFrame")
+        if set(self.segment_by) & set(self.targets):
+            raise ValueError("segment_by cannot include a target column")
+        self.group_by: List[str] = [group_by] if isinstance(group_by, str) else list(group_by or [])
+        self.split_column = split_column
+        self.max_group_overlap = max_group_overlap
+        if self.group_by:
+            if split_column is None:
+                raise ValueError("group_by requires split_column")
+            if not isinstance(self.df, pd.DataFrame):
+                raise TypeError("group_by requires a pandas DataFrame")
 
-    def run(self) -> SanityReport:
-        """Run all checks and return a SanityReport (never raises)."""
-        logger.info("Running DatasetSanity checks (task=%s, target=%s)", self.task, self.target)
+    @property
+    def targets(self) -> List[str]:
+        """The target columns as a list."""
+        if isinstance(self.target, str):
+            return [self.target]
+        return list(self.target)
 
-        # --- missing values ---
+    def _missing_result(self, null_counts: pd.Series, quiet: bool = False) -> CheckResult:
+        info, warn = (logger.debug, logger.debug) if quiet else (logger.info, logger.warning)
         try:
-            check_missing_values(self.df)
-            missing_result = CheckResult(passed=True, details={})
-            logger.info("Missing values check: PASSED")
+            check_missing_values(self.df, null_counts=null_counts)
+            info("Missing values check: PASSED")
+            return CheckResult(passed=True, details={})
         except MissingValuesError as exc:
-            missing_result = CheckResult(
+            warn("Missing values check: FAILED — %s", exc)
+            return CheckResult(
                 passed=False,
                 details={"affected_columns": list(exc.columns) if exc.columns else []},
             )
-            logger.warning("Missing values check: FAILED — %s", exc)
         except DatasetSanityError as exc:
-            missing_result = CheckResult(passed=False, details={"error": str(exc)})
-            logger.warning("Missing values check: FAILED — %s", exc)
-
-        # --- class imbalance (classification only) ---
-        if self.task == "classification":
-            try:
-                check_class_imbalance(self.df, target_column=self.target, threshold=self.imbalance_threshold)
-                imbalance_result = CheckResult(passed=True, details={})
-                logger.info("Class imbalance check: PASSED")
-            except ClassImbalanceError as exc:
-                imbalance_result = CheckResult(
-                    passed=False,
-                    details={
-                        "target_column": exc.target_column,
-                        "imbalance_ratio": exc.imbalance_ratio,
-                    },
-                )
-                logger.warning("Class imbalance check: FAILED — %s", exc)
-            except DatasetSanityError as exc:
-                imbalance_result = CheckResult(passed=False, details={"error": str(exc)})
-                logger.warning("Class imbalance check: FAILED — %s", exc)
-        else:
-            imbalance_result = CheckResult(passed=True, details={"skipped": "regression task"})
+            warn("Missing values check: FAILED — %s", exc)
+            return CheckResult(passed=False, details={"error": str(exc)})
 
-        # --- data leakage ---
+    def _imbalance_result(self, target: str, ratios: Optional[pd.Series] = None, quiet: bool = False) -> CheckResult:
+        if self.task != "classification":
+            return CheckResult(passed=True, details={"skipped": "regression task"})
+        info, warn = (logger.debug, logger.debug) if quiet else (logger.info, logger.warning)
         try:
-            check_data_leakage(self.df, target_column=self.target, correlation_threshold=self.correlation_threshold)
-            leakage_result = CheckResult(passed=True, details={})
-            logger.info("Data leakage check: PASSED")
+            check_class_imbalance(self.df, target_column=target, threshold=self.imbalance_threshold, ratios=ratios)
+            info("Class imbalance check (%s): PASSED", target)
+            return CheckResult(passed=True, details={})
+        except ClassImbalanceError as exc:
+            warn("Class imbalance check (%s): FAILED — %s", target, exc)
+            return CheckResult(
+                passed=False,
+                details={
+                    "target_column": exc.target_column,
+                    "imbalance_ratio": exc.imbalance_ratio,
+                },
+            )
+        except DatasetSanityError as exc:
+            warn("Class imbalance check (%s): FAILED — %s", target, exc)
+            return CheckResult(passed=False, details={"error": str(exc)})
+
+    def _leakage_result(self, target: str, correlations: pd.DataFrame, quiet: bool = False) -> CheckResult:
+        info, warn = (logger.debug, logger.debug) if quiet else (logger.info, logger.warning)
+        if target in self.df.columns and target not in correlations.columns:
+            # non-numeric target: nothing to correlate against
+            info("Data leakage check (%s): PASSED", target)
+            return CheckResult(passed=True, details={})
+        try:
+            check_data_leakage(
+                self.df,
+                target_column=target,
+                correlation_threshold=self.correlation_threshold,
+                correlations=correlations[target] if target in correlations.columns else None,
+            )
+            info("Data leakage check (%s): PASSED", target)
+            return CheckResult(passed=True, details={})
         except DataLeakageError as exc:
-            leakage_result = CheckResult(
+            warn("Data leakage check (%s): FAILED — %s", target, exc)
+            return CheckResult(
                 passed=False,
                 details={"leaked_features": list(exc.features) if exc.features else []},
             )
-            logger.warning("Data leakage check: FAILED — %s", exc)
         except DatasetSanityError as exc:
-            leakage_result = CheckResult(passed=False, details={"error": str(exc)})
-            logger.warning("Data leakage check: FAILED — %s", exc)
+            warn("Data leakage check (%s): FAILED — %s", target, exc)
+            return CheckResult(passed=False, details={"error": str(exc)})
+
+    def _group_leakage_result(self) -> CheckResult:
+        try:
+            check_group_leakage(
+                self.df,
+                self.group_by,
+                split_column=self.split_column,
+                max_overlap_rate=self.max_group_overlap,
+            )
+            logger.info("Group leakage check: PASSED")
+            return CheckResult(passed=True, details={})
+        except GroupLeakageError as exc:
+            logger.warning("Group leakage check: FAILED — %s", exc)
+            return CheckResult(
+                passed=False,
+                details={"group_columns": list(exc.group_columns or []), "overlaps": exc.overlaps},
+            )
+        except (DatasetSanityError, ValueError) as exc:
+            logger.warning("Group leakage check: FAILED — %s", exc)
+            return CheckResult(passed=False, details={"error": str(exc)})
+
+    @staticmethod
+    def _combine(results: Dict[str, CheckResult]) -> CheckResult:
+        failed = [target for target, result in results.items() if not result.passed and result.status != NOT_REACHED]
+        statuses = {result.status for result in results.values()}
+        if statuses == {COMPLETED} or any(results[target].status == COMPLETED for target in failed):
+            status = COMPLETED
+        elif statuses == {NOT_REACHED}:
+            status = NOT_REACHED
+        else:
+            status = ESTIMATED
+        return CheckResult(
+            passed=all(result.passed for result in results.values()),
+            details={"failed_targets": failed} if failed else {},
+            status=status,
+        )
+
+    def _build_report(
+        self,
+        null_counts: pd.Series,
+        correlations: pd.DataFrame,
+        ratios: Optional[Dict[str, pd.Series]] = None,
+        quiet: bool = False,
+    ) -> SanityReport:
+        ratios = ratios or {}
+        missing_result = self._missing_result(null_counts, quiet=quiet)
+        per_target = {
+            target: TargetResult(
+                class_imbalance=self._imbalance_result(target, ratios=ratios.get(target), quiet=quiet),
+                leakage=self._leakage_result(target, correlations, quiet=quiet),
+            )
+            for target in self.targets
+        }
+        return self._assemble(missing_result, per_target)
+
+    def _assemble(self, missing_result: CheckResult, per_target: Dict[str, TargetResult]) -> SanityReport:
+        if isinstance(self.target, str):
+            only = per_target[self.target]
+            return SanityReport(
+                missing_values=missing_result,
+                class_imbalance=only.class_imbalance,
+                leakage=only.leakage,
+            )
 
         return SanityReport(
             missing_values=missing_result,
-            class_imbalance=imbalance_result,
-            leakage=leakage_result,
+            class_imbalance=self._combine({t: r.class_imbalance for t, r in per_target.items()}),
+            leakage=self._combine({t: r.leakage for t, r in per_target.items()}),
+            targets=per_target,
+        )
+
+    def _segment_imbalance(self, target: str, ratios: pd.Series, positions: np.ndarray, n: int) -> List[CheckResult]:
+        dominant = ratios.groupby(positions, sort=False).max().reindex(range(n)).to_numpy(dtype=float)
+        failed = dominant >= self.imbalance_threshold
+        return [
+            CheckResult(passed=False, details={"target_column": target, "imbalance_ratio": float(ratio)})
+            if fail
+            else CheckResult(passed=True, details={})
+            for ratio, fail in zip(dominant, failed)
+        ]
+
+    def _segment_leakage(self, correlations: Optional[pd.DataFrame], n: int) -> List[CheckResult]:
+        if correlations is None:
+            return [CheckResult(passed=True, details={}) for _ in range(n)]
+        features = np.asarray(correlations.columns, dtype=object)
+        leaked = (correlations >= self.correlation_threshold).to_numpy()
+        return [
+            CheckResult(passed=False, details={"leaked_features": list(features[row])})
+            if row.any()
+            else CheckResult(passed=True, details={})
+            for row in leaked
+        ]
+
+    def _segment_reports(self) -> Dict[Tuple[Any, ...], SanityReport]:
+        null_counts, ratios, correlations = segment_scan(
+            self.df,
+            self.targets,
+            self.segment_by,
+            class_targets=self.task == "classification",
         )
+        n = len(null_counts)
+        # verdicts for all segments at once on the segments x columns frames;
+        # only failing segments need their details picked out
+        columns = np.asarray(null_counts.columns, dtype=object)
+        missing = [
+            CheckResult(passed=False, details={"affected_columns": list(columns[row])})
+            if row.any()
+            else CheckResult(passed=True, details={})
+            for row in (null_counts > 0).to_numpy()
+        ]
+        imbalance: Dict[str, List[CheckResult]] = {}
+        for target in self.targets:
+            if self.task != "classification":
+                imbalance[target] = [CheckResult(passed=True, details={"skipped": "regression task"}) for _ in range(n)]
+                continue
+            # align by segment position: tuple keys holding NaN never compare equal
+            positions = null_counts.index.get_indexer(ratios[target].index.droplevel(-1))
+            imbalance[target] = self._segment_imbalance(target, ratios[target], positions, n)
+        leakage = {target: self._segment_leakage(correlations.get(target), n) for target in self.targets}
+
+        reports: Dict[Tuple[Any, ...], SanityReport] = {}
+        for position, key in enumerate(null_counts.index):
+            key = key if isinstance(key, tuple) else (key,)
+            per_target = {
+                target: TargetResult(class_imbalance=imbalance[target][position], leakage=leakage[target][position])
+                for target in self.targets
+            }
+            reports[key] = self._assemble(missing[position], per_target)
+        return reports
+
+    @staticmethod
+    def _mark(result: CheckResult, rows: int, n_rows: int, certain: bool = False) -> CheckResult:
+        """Set the status of a check that saw only ``rows`` of ``n_rows`` rows.
+
+        ``certain`` means the partial verdict can no longer change.
+        """
+        if rows >= n_rows:
+            return result
+        if rows == 0:
+            return CheckResult.not_reached()
+        result.details["rows_scanned"] = rows
+        if not certain:
+            result.status = ESTIMATED
+        return result
+
+    def _run_incremental(self, fail_fast: bool, deadline: Optional[float], chunk_rows: int) -> SanityReport:
+        if not isinstance(self.df, pd.DataFrame):
+            raise TypeError("fail_fast and deadline require a pandas DataFrame")
+        df = self.df
+        for target in self.targets:
+            if target not in df.columns:
+                raise ValueError(f"Target column '{target}' not found")
+
+        started = time.perf_counter()
+        n_rows = len(df)
+
+        def out_of_time() -> bool:
+            return deadline is not None and time.perf_counter() - started >= deadline
+
+        def chunks(columns: List[str]) -> Iterator[pd.DataFrame]:
+            for start in range(0, n_rows, chunk_rows):
+                if out_of_time():
+                    return
+                yield df.iloc[start : start + chunk_rows][columns]
+
+        def scan(columns: List[str], update: Callable[[pd.DataFrame], bool]) -> int:
+            """Feed chunks to ``update`` until it reports a certain failure; return rows seen."""
+            rows = 0
+            for chunk in chunks(columns):
+                rows += len(chunk)
+                if update(chunk) and fail_fast:
+                    break
+            return rows
+
+        # 1. missing values: any NaN is a certain failure
+        null_counts = pd.Series(0, index=df.columns, dtype="int64")
+
+        def count_nulls(chunk: pd.DataFrame) -> bool:
+            nonlocal null_counts
+            null_counts = null_counts + missing_value_counts(chunk)
+            return bool(null_counts.any())
+
+        rows = scan(list(df.columns), count_nulls)
+        missing_result = self._missing_result(null_counts)
+        missing_result = self._mark(missing_result, rows, n_rows, certain=not missing_result.passed)
+        stop = fail_fast and not missing_result.passed
+
+        # 2. class imbalance: certain once one class covers threshold of all rows
+        imbalance: Dict[str, CheckResult] = {}
+        for target in self.targets:
+            if self.task != "classification":
+                imbalance[target] = self._imbalance_result(target)
+                continue
+            if stop:
+                imbalance[target] = CheckResult.not_reached()
+                continue
+            counts = pd.Series(dtype="float64")
+            certain = False
+
+            def count_classes(chunk: pd.DataFrame, target: str = target) -> bool:
+                nonlocal counts, certain
+                counts = counts.add(chunk[target].value_counts(), fill_value=0)
+                certain = bool(len(counts)) and counts.max() / n_rows >= self.imbalance_threshold
+                return certain
+
+            rows = scan([target], count_classes)
+            total = counts.sum()
+            ratios = (counts / total).sort_values(ascending=False) if total else pd.Series([], dtype=float)
+            imbalance[target] = self._mark(self._imbalance_result(target, ratios=ratios), rows, n_rows, certain=certain)
+            stop = fail_fast and not imbalance[target].passed
+
+        # 3. leakage: only an estimate until every row has been seen
+        numeric = [
+            col for col, dtype in df.dtypes.items()
+            if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+        ]
+        features = [col for col in numeric if col not in set(self.targets)]
+        leakage: Dict[str, CheckResult] = {}
+        for target in self.targets:
+            if stop:
+                leakage[target] = CheckResult.not_reached()
+                continue
+            if target not in numeric or not features:
+                leakage[target] = self._leakage_result(target, pd.DataFrame())
+                continue
+            accumulator = CorrelationAccumulator(features, target)
+
+            def accumulate(chunk: pd.DataFrame, accumulator: CorrelationAccumulator = accumulator) -> bool:
+                accumulator.update(chunk)
+                return False
+
+            rows = scan(features + [target], accumulate)
+            correlations = pd.DataFrame({target: accumulator.correlations()})
+            leakage[target] = self._mark(self._leakage_result(target, correlations), rows, n_rows)
+            stop = fail_fast and not leakage[target].passed
+
+        per_target = {
+            target: TargetResult(class_imbalance=imbalance[target], leakage=leakage[target])
+            for target in self.targets
+        }
+        return self._assemble(missing_result, per_target)
+
+    def report_from_stats(
+        self,
+        null_counts: pd.Series,
+        correlations: pd.DataFrame,
+        ratios: Optional[Dict[str, pd.Series]] = None,
+    ) -> SanityReport:
+        """Build a report from precomputed statistics, e.g. a ``StreamingScan``.
+
+        ``self.df`` only needs the right columns; it may be empty.
+        """
+        return self._build_report(null_counts, correlations, ratios=ratios)
+
+    def scan(self) -> Tuple[pd.Series, pd.DataFrame]:
+        """Return the shared null-count and correlation scan used by ``run``."""
+        return scan_dataset(self.df, self.targets)
+
+    def run(
+        self,
+        scan: Optional[Tuple[pd.Series, pd.DataFrame]] = None,
+        fail_fast: bool = False,
+        deadline: Optional[float] = None,
+        chunk_rows: int = 100_000,
+    ) -> SanityReport:
+        """Run all checks and return a SanityReport (never raises).
+
+        ``scan`` may be a cached result of ``scan()`` for the same data and targets.
+        With ``segment_by`` set, ``report.segments`` also holds one report per segment.
+
+        ``fail_fast`` stops at the first certain failure (e.g. the first chunk
+        containing a NaN); ``deadline`` is a time budget in seconds. Both scan
+        ``chunk_rows`` rows at a time in priority order (missing values, class
+        imbalance, leakage) and mark each check as completed, estimated or
+        not reached.
+
+        With ``group_by`` set, ``report.group_leakage`` holds the cross-split
+        entity check; it runs last and is not reached if a fail-fast run has
+        already failed or the deadline has passed.
+        """
+        logger.info("Running DatasetSanity checks (task=%s, target=%s)", self.task, ", ".join(self.targets))
+
+        if fail_fast or deadline is not None:
+            if self.segment_by:
+                raise ValueError("segment_by cannot be combined with fail_fast or deadline")
+            started = time.perf_counter()
+            report = self._run_incremental(fail_fast, deadline, chunk_rows)
+            if self.group_by:
+                stopped = (fail_fast and not report.passed) or (
+                    deadline is not None and time.perf_counter() - started >= deadline
+                )
+                report.group_leakage = CheckResult.not_reached() if stopped else self._group_leakage_result()
+            return report
+
+        # --- shared scans ---
+        null_counts, correlations = scan if scan is not None else self.scan()
+        report = self._build_report(null_counts, correlations)
+
+        if self.segment_by:
+            report.segment_by = list(self.segment_by)
+            report.segments = self._segment_reports()
+            failed = sum(not segment.passed for segment in report.segments.values())
+            logger.info("Segmented checks: %d segments, %d failed", len(report.segments), failed)
+
+        if self.group_by:
+            report.group_leakage = self._group_leakage_result()
+
+        return report
+
+    async def arun(self, executor: Optional[Executor] = None, **kwargs: Any) -> SanityReport:
+        """Awaitable ``run``: the checks execute in ``executor`` (default: the loop's)."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, functools.partial(self.run, **kwargs))
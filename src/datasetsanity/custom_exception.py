@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional, Sequence, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 
 class DatasetSanityError(Exception):
@@ -67,4 +67,30 @@ class DataLeakageError(DatasetSanityError):
         else:
             message = message or "Potential data leakage detected in dataset."
 
-        super().__init__(message)
\ No newline at end of file
+        super().__init__(message)
+
+
+class GroupLeakageError(DatasetSanityError):
+    """Raised when the same entity (group key) appears in more than one split."""
+
+    def __init__(
+        self,
+        group_columns: Optional[Sequence[str]] = None,
+        overlaps: Optional[Sequence[Dict[str, Any]]] = None,
+        message: Optional[str] = None,
+    ) -> None:
+        self.group_columns: Optional[Tuple[str, ...]] = tuple(group_columns) if group_columns else None
+        self.overlaps: List[Dict[str, Any]] = list(overlaps) if overlaps else []
+
+        if self.group_columns and self.overlaps:
+            pairs = ", ".join(
+                f"{'/'.join(str(split) for split in item['splits'])} ({item['overlap']} shared)"
+                for item in self.overlaps
+            )
+            message = message or (
+                f"Entities from {', '.join(self.group_columns)} appear in multiple splits: {pairs}"
+            )
+        else:
+            message = message or "Entities appear in multiple dataset splits."
+
+        super().__init__(message)
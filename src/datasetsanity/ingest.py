@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from datasetsanity.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _parser_engine() -> str:
+    """``"pyarrow"`` (multithreaded) when installed, else pandas' C parser."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return "c"
+    return "pyarrow"
+
+
+def infer_schema(
+    sample: pd.DataFrame,
+    category_ratio: float = 0.5,
+    keep_dtypes: Sequence[str] = (),
+) -> Dict[str, str]:
+    """
+    Pick parse dtypes from a sample of the file.
+
+    String columns whose sample has at most ``category_ratio`` distinct values
+    per row are read as ``category``. Columns in ``keep_dtypes`` are left to
+    the parser. Numeric columns are not fixed here: the sample cannot prove
+    the value range of the whole file, so they are downcast after parsing.
+    """
+    schema: Dict[str, str] = {}
+    for col in sample.columns:
+        if col in keep_dtypes:
+            continue
+        values = sample[col]
+        if pd.api.types.is_numeric_dtype(values) or pd.api.types.is_bool_dtype(values):
+            continue
+        non_null = values.dropna()
+        if len(non_null) and non_null.nunique() <= category_ratio * len(non_null):
+            schema[col] = "category"
+    return schema
+
+
+def downcast_integers(df: pd.DataFrame, keep_dtypes: Sequence[str] = ()) -> pd.DataFrame:
+    """Store integer columns in the smallest integer type that holds their values."""
+    for col in df.columns:
+        if col not in keep_dtypes and pd.api.types.is_integer_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col], downcast="integer")
+    return df
+
+
+def read_csv_fast(
+    path: str,
+    usecols: Optional[Sequence[str]] = None,
+    keep_dtypes: Sequence[str] = (),
+    sample_rows: int = 10_000,
+    category_ratio: float = 0.5,
+) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """
+    Read a CSV with a compact schema inferred from its first ``sample_rows`` rows.
+
+    Only ``usecols`` are parsed (all columns if None), low-cardinality strings
+    become categoricals, integers are downcast and the multithreaded pyarrow
+    parser is used when available. Columns in ``keep_dtypes`` (e.g. group
+    keys) keep the parser's default dtype.
+
+    Returns the DataFrame and a stats dict with the ``engine``, parse
+    ``seconds``, the frame's ``bytes`` and ``default_bytes``, an estimate of
+    what a plain ``pd.read_csv`` of every column would have used (scaled up
+    from the sample).
+    """
+    sample = pd.read_csv(path, nrows=sample_rows)
+    columns: List[str] = list(sample.columns) if usecols is None else list(dict.fromkeys(usecols))
+    missing = [col for col in columns if col not in sample.columns]
+    if missing:
+        raise ValueError(f"Columns not found in {path}: {', '.join(map(str, missing))}")
+
+    schema = infer_schema(sample[columns], category_ratio=category_ratio, keep_dtypes=keep_dtypes)
+    engine = _parser_engine()
+
+    started = time.perf_counter()
+    try:
+        # pyarrow rejects some dtype overrides (e.g. integer columns with
+        # nulls), so it parses with its own types and categories are cast after
+        df = pd.read_csv(path, usecols=columns, engine=engine)
+        if schema:
+            df = df.astype(schema)
+    except (ValueError, TypeError, ImportError) as exc:
+        if engine == "c":
+            raise
+        # older pandas has no pyarrow engine; pyarrow may also reject the file
+        logger.debug("pyarrow parse of %s failed (%s); using the C parser", path, exc)
+        engine = "c"
+        df = pd.read_csv(path, usecols=columns, dtype=schema, engine=engine)
+    df = downcast_integers(df, keep_dtypes=keep_dtypes)
+    seconds = time.perf_counter() - started
+
+    sample_bytes = int(sample.memory_usage(deep=True, index=False).sum())
+    stats = {
+        "engine": engine,
+        "seconds": seconds,
+        "rows": len(df),
+        "columns": len(columns),
+        "bytes": int(df.memory_usage(deep=True, index=False).sum()),
+        "default_bytes": int(sample_bytes / len(sample) * len(df)) if len(sample) else 0,
+    }
+    logger.debug(
+        "Parsed %s in %.2fs (%s engine, %d of %d columns)",
+        path,
+        seconds,
+        engine,
+        len(columns),
+        len(sample.columns),
+    )
+    return df, stats
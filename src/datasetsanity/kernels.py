@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import importlib.util
+import os
+from typing import Any, Callable, Optional, Tuple
+
+import numpy as np
+
+from datasetsanity.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Set DATASETSANITY_DISABLE_JIT=1 to force the pure-NumPy kernels.
+HAS_NUMBA = importlib.util.find_spec("numba") is not None and os.environ.get(
+    "DATASETSANITY_DISABLE_JIT", ""
+) not in ("1", "true", "yes")
+
+# Blocks with fewer elements (rows x columns) than this use the NumPy kernels:
+# importing numba and loading the compiled kernel costs far more than it saves
+# on them, so numba is only imported once a block reaches this size.
+JIT_MIN_SIZE = 1_000_000
+
+
+def _numpy_column_scan(x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    nan_x = np.isnan(x)
+    null_counts = nan_x.sum(axis=0)
+    if x.shape[0] == 0:
+        return null_counts, np.full((x.shape[1], y.shape[1]), np.nan)
+
+    if not null_counts.any() and not np.isnan(y).any():
+        xc = x - x.mean(axis=0)
+        yc = y - y.mean(axis=0)
+        x_norm = np.sqrt((xc * xc).sum(axis=0))
+        y_norm = np.sqrt((yc * yc).sum(axis=0))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = (xc.T @ yc) / np.outer(x_norm, y_norm)
+        corr[~np.isfinite(corr)] = np.nan
+        return null_counts, np.abs(corr)
+
+    x_valid = ~nan_x
+    corr = np.empty((x.shape[1], y.shape[1]))
+    for j in range(y.shape[1]):
+        mask = x_valid & ~np.isnan(y[:, j])[:, None]
+        n = mask.sum(axis=0)
+        xm = np.where(mask, x, 0.0)
+        ym = np.where(mask, y[:, j][:, None], 0.0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            xc = np.where(mask, xm - xm.sum(axis=0) / n, 0.0)
+            yc = np.where(mask, ym - ym.sum(axis=0) / n, 0.0)
+            col = (xc * yc).sum(axis=0) / np.sqrt((xc * xc).sum(axis=0) * (yc * yc).sum(axis=0))
+        col[~np.isfinite(col) | (n < 2)] = np.nan
+        corr[:, j] = np.abs(col)
+    return null_counts, corr
+
+
+_compiled_scan: Optional[Callable[..., Any]] = None
+
+
+def _build_numba_column_scan() -> Callable[..., Any]:
+    import numba
+
+    @numba.njit(parallel=True, cache=True)
+    def _numba_column_scan(x, y):  # type: ignore[no-untyped-def]
+        n_rows, n_cols = x.shape
+        n_targets = y.shape[1]
+        null_counts = np.zeros(n_cols, dtype=np.int64)
+        corr = np.empty((n_cols, n_targets))
+
+        for j in numba.prange(n_cols):
+            n = np.zeros(n_targets)
+            sx = np.zeros(n_targets)
+            sy = np.zeros(n_targets)
+            # pass 1: null count and pairwise-complete sums
+            for i in range(n_rows):
+                v = x[i, j]
+                if np.isnan(v):
+                    null_counts[j] += 1
+                    continue
+                for t in range(n_targets):
+                    w = y[i, t]
+                    if not np.isnan(w):
+                        n[t] += 1.0
+                        sx[t] += v
+                        sy[t] += w
+            # pass 2: centred cross products
+            sxx = np.zeros(n_targets)
+            syy = np.zeros(n_targets)
+            sxy = np.zeros(n_targets)
+            for i in range(n_rows):
+                v = x[i, j]
+                if np.isnan(v):
+                    continue
+                for t in range(n_targets):
+                    w = y[i, t]
+                    if not np.isnan(w):
+                        dx = v - sx[t] / n[t]
+                        dy = w - sy[t] / n[t]
+                        sxx[t] += dx * dx
+                        syy[t] += dy * dy
+                        sxy[t] += dx * dy
+            for t in range(n_targets):
+                denom = np.sqrt(sxx[t] * syy[t])
+                if n[t] < 2 or denom == 0.0:
+                    corr[j, t] = np.nan
+                else:
+                    corr[j, t] = abs(sxy[t] / denom)
+        return null_counts, corr
+
+    return _numba_column_scan
+
+
+def _numba_column_scan(x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Parallel Numba scan; numba is imported and the kernel loaded on first use."""
+    global _compiled_scan
+    if _compiled_scan is None:
+        _compiled_scan = _build_numba_column_scan()
+    null_counts, corr = _compiled_scan(x, y)
+    return np.asarray(null_counts), np.asarray(corr)
+
+
+def column_scan(x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Fused scan of a numeric block against one or more targets.
+
+    ``x`` is (rows x columns) and ``y`` is (rows x targets), both float64.
+    Returns the NaN count of every column of ``x`` and the absolute Pearson
+    correlation of every column with every target, dropping rows where
+    either side is NaN. Uses a parallel Numba kernel over column-contiguous
+    buffers when Numba is installed and ``x`` has at least ``JIT_MIN_SIZE``
+    elements, vectorised NumPy otherwise. If Numba fails to import or
+    compile, the NumPy kernels are used for the rest of the process.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    global HAS_NUMBA
+    if HAS_NUMBA and x.size >= JIT_MIN_SIZE and y.size:
+        try:
+            null_counts, corr = _numba_column_scan(np.asfortranarray(x), np.ascontiguousarray(y))
+            return null_counts.astype(np.int64), corr
+        except Exception as exc:  # broken install (ImportError) or a numba compile error
+            logger.warning("Numba kernel unavailable (%s); using NumPy kernels from now on", exc)
+            HAS_NUMBA = False
+    null_counts, corr = _numpy_column_scan(x, y)
+    return null_counts.astype(np.int64), corr
+
+
+def class_counts(codes: np.ndarray, n_classes: int) -> np.ndarray:
+    """Count occurrences of each class code, ignoring negative (missing) codes."""
+    codes = np.asarray(codes)
+    return np.bincount(codes[codes >= 0], minlength=n_classes)
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+# The logger (which creates logs/ and a file handler) is imported only when
+# a report is written, so ``check --server`` clients never set it up.
+
+_PASS = "\u2714"
+_WARN = "\u26a0"
+_FAIL = "\u274c"
+
+
+def _jsonable(value: Any) -> Any:
+    """Convert a segment key value (NumPy scalar, timestamp, NaN) to plain JSON."""
+    if hasattr(value, "item"):
+        value = value.item()
+    if isinstance(value, float) and value != value:
+        return None
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+COMPLETED = "completed"
+ESTIMATED = "estimated"
+NOT_REACHED = "not_reached"
+
+
+class CheckResult:
+    """Stores the outcome of a single sanity check.
+
+    ``status`` is ``"completed"`` unless a fail-fast or deadline run stopped
+    early: ``"estimated"`` verdicts come from part of the rows and
+    ``"not_reached"`` checks never ran (and do not count as passed).
+    """
+
+    def __init__(self, passed: bool, details: Dict[str, Any], status: str = COMPLETED) -> None:
+        self.passed = passed
+        self.details = details
+        self.status = status
+
+    @classmethod
+    def not_reached(cls) -> "CheckResult":
+        return cls(passed=False, details={}, status=NOT_REACHED)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {"passed": self.passed, "details": self.details}
+        if self.status != COMPLETED:
+            data["status"] = self.status
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CheckResult":
+        return cls(passed=data["passed"], details=data["details"], status=data.get("status", COMPLETED))
+
+
+class TargetResult:
+    """Stores the target-specific check outcomes for one target column."""
+
+    def __init__(self, class_imbalance: CheckResult, leakage: CheckResult) -> None:
+        self.class_imbalance = class_imbalance
+        self.leakage = leakage
+
+    @property
+    def passed(self) -> bool:
+        return self.class_imbalance.passed and self.leakage.passed
+
+
+class SanityReport:
+    """Aggregates the results of all three DatasetSanity checks.
+
+    When several targets were checked, ``targets`` holds one ``TargetResult``
+    per target and ``class_imbalance`` / ``leakage`` summarise them.
+
+    For segmented runs, ``segments`` maps each segment key (a tuple of the
+    ``segment_by`` column values) to that segment's own report.
+
+    ``group_leakage`` is only set when entities were checked across splits.
+    """
+
+    def __init__(
+        self,
+        missing_values: CheckResult,
+        class_imbalance: CheckResult,
+        leakage: CheckResult,
+        targets: Optional[Dict[str, TargetResult]] = None,
+        segments: Optional[Dict[Tuple[Any, ...], "SanityReport"]] = None,
+        segment_by: Optional[List[str]] = None,
+        group_leakage: Optional[CheckResult] = None,
+    ) -> None:
+        self.missing_values = missing_values
+        self.class_imbalance = class_imbalance
+        self.leakage = leakage
+        self.targets = targets
+        self.segments = segments
+        self.segment_by = segment_by
+        self.group_leakage = group_leakage
+
+    @property
+    def passed(self) -> bool:
+        if self.segments and not all(segment.passed for segment in self.segments.values()):
+            return False
+        if self.group_leakage is not None and not self.group_leakage.passed:
+            return False
+        return self.missing_values.passed and self.class_imbalance.passed and self.leakage.passed
+
+    def _symbol(self, passed: bool) -> str:
+        return _PASS if passed else _FAIL
+
+    def _print_result(self, name: str, result: CheckResult, indent: str = "  ") -> None:
+        if result.status == NOT_REACHED:
+            print(f"{indent}{_WARN}  {name}: NOT REACHED")
+            return
+        symbol = self._symbol(result.passed)
+        status = "PASSED" if result.passed else "FAILED"
+        if result.status == ESTIMATED:
+            status += " (estimated)"
+        print(f"{indent}{symbol}  {name}: {status}")
+        if result.details:
+            for key, value in result.details.items():
+                print(f"{indent}     {key}: {value}")
+
+    def summary(self) -> None:
+        """Print a human-readable console report."""
+        print("DatasetSanity Report")
+        print("=" * 40)
+
+        for name, result in [
+            ("Missing Values", self.missing_values),
+            ("Class Imbalance", self.class_imbalance),
+            ("Data Leakage", self.leakage),
+        ]:
+            self._print_result(name, result)
+        if self.group_leakage is not None:
+            self._print_result("Group Leakage", self.group_leakage)
+
+        if self.targets:
+            for target, target_result in self.targets.items():
+                print("-" * 40)
+                print(f"  Target: {target}")
+                self._print_result("Class Imbalance", target_result.class_imbalance, indent="    ")
+                self._print_result("Data Leakage", target_result.leakage, indent="    ")
+
+        if self.segments is not None:
+            failed = [key for key, segment in self.segments.items() if not segment.passed]
+            print("-" * 40)
+            print(f"  Segments by {', '.join(self.segment_by or [])}: {len(self.segments)} checked, {len(failed)} failed")
+            for key in failed:
+                print(f"    {_FAIL}  {', '.join(str(value) for value in key)}")
+
+        print("=" * 40)
+        overall = self.passed
+        overall_symbol = _PASS if overall else _WARN
+        overall_status = "All checks passed" if overall else "Some checks failed"
+        print(f"  {overall_symbol}  Overall: {overall_status}")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the report results as a JSON-serialisable dict."""
+        data: Dict[str, Any] = {
+            "missing_values": self.missing_values.to_dict(),
+            "class_imbalance": self.class_imbalance.to_dict(),
+            "leakage": self.leakage.to_dict(),
+        }
+        if self.group_leakage is not None:
+            data["group_leakage"] = self.group_leakage.to_dict()
+        if self.targets:
+            data["targets"] = {
+                target: {
+                    "class_imbalance": result.class_imbalance.to_dict(),
+                    "leakage": result.leakage.to_dict(),
+                }
+                for target, result in self.targets.items()
+            }
+        if self.segments is not None:
+            data["segment_by"] = self.segment_by
+            data["segments"] = [
+                {"segment": [_jsonable(value) for value in key], **segment.to_dict()}
+                for key, segment in self.segments.items()
+            ]
+        return data
+
+    def segment_table(self) -> Any:
+        """
+        Return one row per segment as a pandas DataFrame.
+
+        Columns are the ``segment_by`` values, a pass flag per check, and the
+        affected columns / imbalance ratio / leaked features where available.
+        """
+        import pandas as pd
+
+        if self.segments is None:
+            raise ValueError("Report has no segments; run DatasetSanity with segment_by")
+
+        rows = []
+        for key, segment in self.segments.items():
+            row: Dict[str, Any] = dict(zip(self.segment_by or [], key))
+            row.update(
+                missing_values=segment.missing_values.passed,
+                class_imbalance=segment.class_imbalance.passed,
+                leakage=segment.leakage.passed,
+                passed=segment.passed,
+                affected_columns=segment.missing_values.details.get("affected_columns", []),
+                imbalance_ratio=segment.class_imbalance.details.get("imbalance_ratio"),
+                leaked_features=segment.leakage.details.get("leaked_features", []),
+            )
+            rows.append(row)
+        return pd.DataFrame(rows)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SanityReport":
+        """Rebuild a report from the output of ``to_dict``."""
+        targets = None
+        if "targets" in data:
+            targets = {
+                target: TargetResult(
+                    class_imbalance=CheckResult.from_dict(result["class_imbalance"]),
+                    leakage=CheckResult.from_dict(result["leakage"]),
+                )
+                for target, result in data["targets"].items()
+            }
+        segments = None
+        if "segments" in data:
+            segments = {tuple(entry["segment"]): cls.from_dict(entry) for entry in data["segments"]}
+        return cls(
+            missing_values=CheckResult.from_dict(data["missing_values"]),
+            class_imbalance=CheckResult.from_dict(data["class_imbalance"]),
+            leakage=CheckResult.from_dict(data["leakage"]),
+            targets=targets,
+            segments=segments,
+            segment_by=data.get("segment_by"),
+            group_leakage=CheckResult.from_dict(data["group_leakage"]) if "group_leakage" in data else None,
+        )
+
+    def to_json(self, path: str) -> None:
+        """Write the report results to a JSON file."""
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        from datasetsanity.logger import get_logger
+
+        get_logger(__name__).info("Report written to %s", path)
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import json
+import os
+import socket
+import socketserver
+import stat
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import pandas as pd
+
+from datasetsanity.client import parse_address
+from datasetsanity.core import DatasetSanity
+from datasetsanity.logger import get_logger
+
+logger = get_logger(__name__)
+
+_FileKey = Tuple[str, int, int]
+_Scan = Tuple[pd.Series, pd.DataFrame]
+
+
+class _CacheEntry:
+    """One cached file: loaded and scanned on first use, under its own locks."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.scans: Dict[Tuple[str, ...], _Scan] = {}
+        self._df: Optional[pd.DataFrame] = None
+        self._load_lock = threading.Lock()
+        self._scan_locks: Dict[Tuple[str, ...], threading.Lock] = {}
+        self._scan_locks_guard = threading.Lock()
+
+    def frame(self) -> pd.DataFrame:
+        with self._load_lock:
+            if self._df is None:
+                logger.info("Loading %s", self.path)
+                self._df = pd.read_csv(self.path)
+            return self._df
+
+    def scan(self, checker: DatasetSanity) -> _Scan:
+        key = tuple(checker.targets)
+        with self._scan_locks_guard:
+            lock = self._scan_locks.setdefault(key, threading.Lock())
+        with lock:
+            if key not in self.scans:
+                self.scans[key] = checker.scan()
+            return self.scans[key]
+
+
+class DatasetCache:
+    """
+    LRU cache of loaded CSV files and their per-target scans.
+
+    Entries are keyed by path, modification time and size, so a file that
+    changes on disk is reloaded on the next request. The cache-wide lock only
+    covers the LRU bookkeeping; reading and scanning a file happen under that
+    entry's own locks, so a cold load never blocks requests for other files.
+    """
+
+    def __init__(self, max_datasets: int = 8) -> None:
+        self.max_datasets = max_datasets
+        self._entries: "OrderedDict[_FileKey, _CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(path: str) -> _FileKey:
+        real = os.path.realpath(path)
+        info = os.stat(real)
+        return real, info.st_mtime_ns, info.st_size
+
+    def _entry(self, path: str) -> _CacheEntry:
+        key = self._key(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry
+
+            self.misses += 1
+            # drop stale versions of the same file
+            for stale in [k for k in self._entries if k[0] == key[0]]:
+                del self._entries[stale]
+            entry = _CacheEntry(key[0])
+            self._entries[key] = entry
+            while len(self._entries) > self.max_datasets:
+                self._entries.popitem(last=False)
+            return entry
+
+    def load(self, path: str) -> pd.DataFrame:
+        """Return the DataFrame for ``path``, reading it only on a cache miss."""
+        return self._entry(path).frame()
+
+    def check(
+        self,
+        path: str,
+        fail_fast: bool = False,
+        deadline: Optional[float] = None,
+        **options: Any,
+    ) -> Dict[str, Any]:
+        """Run DatasetSanity on ``path`` and return the report as a dict."""
+        entry = self._entry(path)
+        checker = DatasetSanity(entry.frame(), **options)
+        if fail_fast or deadline is not None:
+            return checker.run(fail_fast=fail_fast, deadline=deadline).to_dict()
+        return checker.run(scan=entry.scan(checker)).to_dict()
+
+
+def handle_request(cache: DatasetCache, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Process one decoded request and return the reply (never raises)."""
+    try:
+        options = {
+            key: payload[key]
+            for key in (
+                "target",
+                "task",
+                "imbalance_threshold",
+                "correlation_threshold",
+                "segment_by",
+                "group_by",
+                "split_column",
+                "max_group_overlap",
+                "fail_fast",
+                "deadline",
+            )
+            if key in payload
+        }
+        report = cache.check(payload["path"], **options)
+    except Exception as exc:  # reported back to the client
+        logger.warning("Request failed — %s", exc)
+        return {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+    return {"ok": True, "report": report}
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            payload = json.loads(line)
+        except ValueError as exc:
+            reply: Dict[str, Any] = {"ok": False, "error": f"Invalid request: {exc}"}
+        else:
+            reply = handle_request(self.server.cache, payload)  # type: ignore[attr-defined]
+        self.wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+    cache: DatasetCache
+
+
+if hasattr(socketserver, "ThreadingUnixStreamServer"):
+
+    class _UnixServer(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+        cache: DatasetCache
+
+
+def make_server(address: str, cache_size: int = 8) -> socketserver.BaseServer:
+    """
+    Create (but do not start) a DatasetSanity server bound to ``address``.
+
+    ``address`` is ``"host:port"`` or a Unix socket path. A stale socket at
+    that path is replaced; any other existing file raises FileExistsError.
+    """
+    family, addr = parse_address(address)
+    cache = DatasetCache(max_datasets=cache_size)
+    if family == socket.AF_INET:
+        tcp_server = _TCPServer(addr, _RequestHandler)
+        tcp_server.cache = cache
+        return tcp_server
+    if os.path.lexists(addr):
+        if not stat.S_ISSOCK(os.lstat(addr).st_mode):
+            raise FileExistsError(f"Refusing to replace non-socket file: {addr}")
+        os.unlink(addr)
+    unix_server = _UnixServer(addr, _RequestHandler)
+    unix_server.cache = cache
+    return unix_server
+
+
+def serve(address: str, cache_size: int = 8) -> None:
+    """Run a DatasetSanity server until interrupted."""
+    server = make_server(address, cache_size=cache_size)
+    logger.info("DatasetSanity server listening on %s", address)
+    with server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("DatasetSanity server stopped")
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from typing import Any, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+def is_scipy_sparse(obj: Any) -> bool:
+    """Return True if ``obj`` is a scipy.sparse matrix or array."""
+    try:
+        import scipy.sparse
+    except ImportError:
+        return False
+    return bool(scipy.sparse.issparse(obj))
+
+
+def from_scipy_sparse(
+    matrix: Any,
+    columns: Optional[Sequence[Any]] = None,
+    index: Optional[Sequence[Any]] = None,
+) -> pd.DataFrame:
+    """
+    Wrap a scipy.sparse matrix as a DataFrame of zero-filled sparse columns.
+
+    Only the stored entries are copied; implicit zeros are never materialised.
+    """
+    import scipy.sparse
+
+    csc = scipy.sparse.csc_matrix(matrix)
+    if not csc.has_sorted_indices:
+        csc = csc.sorted_indices()
+    n_rows, n_cols = csc.shape
+
+    names: List[Any] = list(range(n_cols)) if columns is None else list(columns)
+    if len(names) != n_cols:
+        raise ValueError(f"Expected {n_cols} column names, got {len(names)}")
+
+    # one-column CSC views over the shared buffers; SparseArray.from_spmatrix
+    # keeps the implicit entries as a 0 fill value
+    arrays = {}
+    for i, col in enumerate(names):
+        start, stop = csc.indptr[i], csc.indptr[i + 1]
+        column = scipy.sparse.csc_matrix(
+            (csc.data[start:stop], csc.indices[start:stop], np.array([0, stop - start])),
+            shape=(n_rows, 1),
+        )
+        arrays[col] = pd.arrays.SparseArray.from_spmatrix(column)
+
+    return pd.DataFrame(arrays, index=index)
+
+
+def is_sparse_column(series: pd.Series) -> bool:
+    """Return True if ``series`` is backed by a pandas SparseArray."""
+    return isinstance(series.dtype, pd.SparseDtype)
+
+
+def sparse_null_count(values: pd.arrays.SparseArray) -> int:
+    """Count missing values using only the stored entries of ``values``."""
+    stored = np.asarray(values.sp_values)
+    stored_nulls = int(pd.isnull(stored).sum())
+    if pd.isnull(values.fill_value):
+        return len(values) - len(stored) + stored_nulls
+    return stored_nulls
+
+
+def _pearson_from_moments(
+    n: np.ndarray,
+    sx: np.ndarray,
+    sy: np.ndarray,
+    sxx: np.ndarray,
+    syy: np.ndarray,
+    sxy: np.ndarray,
+) -> np.ndarray:
+    """Absolute Pearson correlation from raw moments, element-wise."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        var_x = sxx - sx * sx / n
+        var_y = syy - sy * sy / n
+        cov = sxy - sx * sy / n
+        corr = np.minimum(np.abs(cov / np.sqrt(var_x * var_y)), 1.0)
+    # guard against rounding noise on (near-)constant columns
+    degenerate = (n < 2) | (var_x <= 1e-12 * np.maximum(sxx, 1.0)) | (var_y <= 1e-12 * np.maximum(syy, 1.0))
+    return np.where(degenerate, np.nan, corr)
+
+
+def sparse_target_correlations(
+    features: Sequence[pd.arrays.SparseArray],
+    targets: np.ndarray,
+) -> np.ndarray:
+    """
+    Absolute Pearson correlation of each sparse feature with dense targets.
+
+    ``targets`` is (rows x targets); the result is (features x targets).
+    The stored entries of all features are concatenated once and every
+    moment is a weighted ``np.bincount`` over them, i.e. a sparse ``X.T @ y``,
+    so the cost is O(nnz) per target with no per-column Python work. The
+    contribution of each fill value is derived from the target moments. Rows
+    where either side is missing are dropped pairwise, matching
+    ``DataFrame.corr``.
+    """
+    k = len(features)
+    y_all = np.asarray(targets, dtype=float).reshape(len(targets), -1)
+    result = np.empty((k, y_all.shape[1]))
+    if not k:
+        return result
+
+    lengths = np.array([values.sp_index.npoints for values in features])
+    rows = np.concatenate([values.sp_index.to_int_index().indices for values in features]).astype(np.intp)
+    stored = np.concatenate([np.asarray(values.sp_values, dtype=float) for values in features])
+    fills = np.array([float(values.fill_value) for values in features])
+    owner = np.repeat(np.arange(k), lengths)
+    stored_nan = np.isnan(stored)
+    nan_fill = np.isnan(fills)
+    fill = np.where(nan_fill, 0.0, fills)
+
+    def per_feature(weights: np.ndarray) -> np.ndarray:
+        return np.bincount(owner, weights=weights, minlength=k)
+
+    for t in range(y_all.shape[1]):
+        y = y_all[:, t]
+        y_valid = ~np.isnan(y)
+        y_clean = np.where(y_valid, y, 0.0)
+        y_at = y_clean[rows]
+
+        keep = ~stored_nan & y_valid[rows]
+        x = np.where(keep, stored, 0.0)
+        yk = np.where(keep, y_at, 0.0)
+        n_stored = per_feature(keep.astype(float))
+        sx_stored, sxx_stored = per_feature(x), per_feature(x * x)
+        sy_stored, syy_stored = per_feature(yk), per_feature(yk * yk)
+        sxy = per_feature(x * yk)
+
+        # rows holding a stored NaN drop out of the target moments
+        dropped = stored_nan & y_valid[rows]
+        yd = np.where(dropped, y_at, 0.0)
+        n = float(y_valid.sum()) - per_feature(dropped.astype(float))
+        sy = float(y_clean.sum()) - per_feature(yd)
+        syy = float((y_clean * y_clean).sum()) - per_feature(yd * yd)
+
+        # with a NaN fill only the stored entries carry data
+        n = np.where(nan_fill, n_stored, n)
+        sy = np.where(nan_fill, sy_stored, sy)
+        syy = np.where(nan_fill, syy_stored, syy)
+        filled = n - n_stored
+        result[:, t] = _pearson_from_moments(
+            n,
+            fill * filled + sx_stored,
+            sy,
+            fill * fill * filled + sxx_stored,
+            syy,
+            fill * (sy - sy_stored) + sxy,
+        )
+    return result
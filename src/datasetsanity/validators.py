@@ -1,48 +1,121 @@
 from __future__ import annotations
 
-from typing import Iterable, Optional
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 
+from datasetsanity.adapters import ArrowFrame, Frame, as_frame
 from datasetsanity.custom_exception import (
     MissingValuesError,
     ClassImbalanceError,
     DataLeakageError,
+    GroupLeakageError,
 )
+from datasetsanity.kernels import class_counts, column_scan
+from datasetsanity.sparse import (
+    is_sparse_column,
+    sparse_null_count,
+    sparse_target_correlations,
+)
+
+
+def _sparse_columns(df: pd.DataFrame) -> List[Any]:
+    """Columns backed by a pandas SparseArray, read from the dtypes only."""
+    return [col for col, dtype in df.dtypes.items() if isinstance(dtype, pd.SparseDtype)]
+
+
+def missing_value_counts(
+    df: Frame,
+    columns: Optional[Iterable[str]] = None,
+) -> pd.Series:
+    """
+    Return the number of missing values per column.
+
+    Sparse columns are counted from their stored entries without densifying;
+    Arrow-backed frames use each column's null_count.
+    """
+    df = as_frame(df)
+    if isinstance(df, ArrowFrame):
+        counts = df.null_counts()
+        return counts if columns is None else counts[list(columns)]
+
+    if columns is not None:
+        df = df[list(columns)]
+
+    sparse_cols = _sparse_columns(df)
+    if not sparse_cols:
+        return df.isnull().sum()
+
+    sparse_set = set(sparse_cols)
+    dense_cols = [col for col in df.columns if col not in sparse_set]
+    sparse_counts = pd.Series({col: sparse_null_count(df[col].array) for col in sparse_cols}, dtype="int64")
+    counts = pd.concat([df[dense_cols].isnull().sum(), sparse_counts])
+    return counts.reindex(df.columns).astype("int64")
 
 
 def check_missing_values(
-    df: pd.DataFrame,
+    df: Frame,
     columns: Optional[Iterable[str]] = None,
+    null_counts: Optional[pd.Series] = None,
 ) -> None:
     """
     Raise MissingValuesError if missing values are detected.
+
+    ``null_counts`` may be passed to reuse a scan from ``missing_value_counts``.
     """
-    if columns is None:
-        columns = df.columns
+    if null_counts is None:
+        null_counts = missing_value_counts(df, columns)
+    elif columns is not None:
+        null_counts = null_counts[list(columns)]
 
     missing_cols = [
-        col for col in columns if df[col].isnull().any()
+        col for col, count in null_counts.items() if count > 0
     ]
 
     if missing_cols:
         raise MissingValuesError(columns=missing_cols)
 
 
+def class_ratios(df: Frame, target_column: str) -> pd.Series:
+    """
+    Return the relative frequency of each class in ``target_column``.
+    """
+    df = as_frame(df)
+    if isinstance(df, ArrowFrame):
+        return df.class_ratios(target_column)
+
+    column = df[target_column]
+    if is_sparse_column(column):
+        return column.value_counts(normalize=True)
+
+    codes, uniques = pd.factorize(column)
+    counts = class_counts(codes, len(uniques))
+    total = counts.sum()
+    if not total:
+        return pd.Series([], dtype=float)
+    return pd.Series(counts / total, index=uniques).sort_values(ascending=False)
+
+
 def check_class_imbalance(
-    df: pd.DataFrame,
+    df: Frame,
     target_column: str,
     threshold: float = 0.9,
+    ratios: Optional[pd.Series] = None,
 ) -> None:
     """
     Raise ClassImbalanceError if the dominant class ratio exceeds threshold.
+
+    ``ratios`` may be passed to reuse the output of ``class_ratios``.
     """
+    df = as_frame(df)
     if target_column not in df.columns:
         raise ValueError(f"Target column '{target_column}' not found")
 
-    class_ratios = df[target_column].value_counts(normalize=True)
+    if ratios is None:
+        ratios = class_ratios(df, target_column)
 
-    max_ratio = class_ratios.max()
+    max_ratio = ratios.max()
     if max_ratio >= threshold:
         raise ClassImbalanceError(
             target_column=target_column,
@@ -50,23 +123,272 @@ def check_class_imbalance(
         )
 
 
-def check_data_leakage(
+# values (rows x columns) per float64 feature batch on the Arrow path, ~64 MB
+_ARROW_BATCH_VALUES = 8_000_000
+
+
+def _arrow_target_correlations(df: ArrowFrame, target_columns: Sequence[str]) -> pd.DataFrame:
+    numeric = df.numeric_columns()
+    target_set = set(target_columns)
+    targets = [col for col in target_columns if col in numeric]
+    features = [col for col in numeric if col not in target_set]
+
+    if not targets or not features:
+        return pd.DataFrame(index=features, columns=targets, dtype=float)
+
+    n_rows = len(df)
+    y = np.empty((n_rows, len(targets)), dtype=np.float64)
+    for i, col in enumerate(targets):
+        y[:, i] = df.to_numpy(col)
+
+    # The kernels need float64, so features are converted from the Arrow
+    # views batch by batch: extra memory stays at one batch (or one column)
+    # instead of a float64 copy of the whole numeric block.
+    batch = max(1, _ARROW_BATCH_VALUES // max(n_rows, 1))
+    corr = np.empty((len(features), len(targets)))
+    for start in range(0, len(features), batch):
+        names = features[start : start + batch]
+        x = np.empty((n_rows, len(names)), dtype=np.float64, order="F")
+        for i, col in enumerate(names):
+            x[:, i] = df.to_numpy(col)
+        _, corr[start : start + len(names)] = column_scan(x, y)
+    return pd.DataFrame(corr, index=features, columns=targets)
+
+
+def _sparse_target_correlations(
+    numeric_df: pd.DataFrame,
+    features: Sequence[str],
+    targets: Sequence[str],
+) -> pd.DataFrame:
+    sparse_set = set(_sparse_columns(numeric_df))
+    sparse_features = [col for col in features if col in sparse_set]
+    dense_features = [col for col in features if col not in sparse_set]
+    target_df = pd.DataFrame(
+        {col: numeric_df[col].to_numpy(dtype=float, na_value=np.nan) for col in targets},
+        index=numeric_df.index,
+    )
+    dense_part = target_correlations(pd.concat([numeric_df[dense_features], target_df], axis=1), targets)
+    sparse_part = pd.DataFrame(
+        sparse_target_correlations([numeric_df[col].array for col in sparse_features], target_df.to_numpy()),
+        index=sparse_features,
+        columns=list(targets),
+    )
+    return pd.concat([dense_part, sparse_part]).reindex(features)
+
+
+def target_correlations(
+    df: Frame,
+    target_columns: Sequence[str],
+) -> pd.DataFrame:
+    """
+    Return absolute Pearson correlations as a features x targets frame.
+
+    Only numeric columns take part and target columns are never treated as
+    features. All targets are handled in one ``kernels.column_scan`` call:
+    a standardized matrix product on complete data, pairwise-complete
+    correlations (as ``DataFrame.corr``) when values are missing.
+    Sparse features are correlated from their stored entries only.
+    """
+    df = as_frame(df)
+    if isinstance(df, ArrowFrame):
+        return _arrow_target_correlations(df, target_columns)
+
+    numeric_df = df.select_dtypes(include="number")
+    target_set = set(target_columns)
+    targets = [col for col in target_columns if col in numeric_df.columns]
+    features = [col for col in numeric_df.columns if col not in target_set]
+
+    if not targets or not features:
+        return pd.DataFrame(index=features, columns=targets, dtype=float)
+
+    if _sparse_columns(numeric_df):
+        return _sparse_target_correlations(numeric_df, features, targets)
+
+    _, corr = column_scan(
+        numeric_df[features].to_numpy(dtype=float, na_value=np.nan),
+        numeric_df[targets].to_numpy(dtype=float, na_value=np.nan),
+    )
+    return pd.DataFrame(corr, index=features, columns=targets)
+
+
+def scan_dataset(
+    df: Frame,
+    target_columns: Sequence[str],
+) -> Tuple[pd.Series, pd.DataFrame]:
+    """
+    Return ``(missing_value_counts, target_correlations)`` for ``df``.
+
+    For dense pandas frames the numeric block is read once: a single
+    ``kernels.column_scan`` pass yields both its null counts and its
+    correlations with every target. Other inputs use the individual helpers.
+    """
+    df = as_frame(df)
+    if isinstance(df, ArrowFrame) or _sparse_columns(df):
+        return missing_value_counts(df), target_correlations(df, target_columns)
+
+    numeric_df = df.select_dtypes(include="number")
+    target_set = set(target_columns)
+    numeric_set = set(numeric_df.columns)
+    targets = [col for col in target_columns if col in numeric_df.columns]
+    features = [col for col in numeric_df.columns if col not in target_set]
+    other = [col for col in df.columns if col not in numeric_set]
+
+    if not targets or numeric_df.shape[1] == 0:
+        return missing_value_counts(df), target_correlations(df, target_columns)
+
+    null_counts, corr = column_scan(
+        numeric_df.to_numpy(dtype=float, na_value=np.nan),
+        numeric_df[targets].to_numpy(dtype=float, na_value=np.nan),
+    )
+    counts = pd.concat(
+        [pd.Series(null_counts, index=numeric_df.columns), df[other].isnull().sum()]
+    ).reindex(df.columns).astype("int64")
+    correlations = pd.DataFrame(corr, index=numeric_df.columns, columns=targets).loc[features]
+    return counts, correlations
+
+
+_MOMENTS = ("n", "sx", "sy", "sxx", "syy", "sxy")
+
+
+def _row_moments(x: np.ndarray, y: np.ndarray) -> Dict[str, np.ndarray]:
+    """Per-row terms of the pairwise-complete moments of each ``x`` column with ``y``."""
+    mask = ~np.isnan(x) & ~np.isnan(y)[:, None]
+    xm = np.where(mask, x, 0.0)
+    ym = np.where(mask, y[:, None], 0.0)
+    return {"n": mask.astype(float), "sx": xm, "sy": ym, "sxx": xm * xm, "syy": ym * ym, "sxy": xm * ym}
+
+
+def _correlations_from_moments(sums: Dict[str, np.ndarray]) -> np.ndarray:
+    """Absolute Pearson correlations from summed moments (NaN when undefined)."""
+    n = sums["n"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        var_x = sums["sxx"] - sums["sx"] ** 2 / n
+        var_y = sums["syy"] - sums["sy"] ** 2 / n
+        cov = sums["sxy"] - sums["sx"] * sums["sy"] / n
+        corr = np.abs(cov / np.sqrt(var_x * var_y))
+    degenerate = (
+        (n < 2)
+        | (var_x <= 1e-12 * np.maximum(sums["sxx"], 1.0))
+        | (var_y <= 1e-12 * np.maximum(sums["syy"], 1.0))
+        | ~np.isfinite(corr)
+    )
+    return np.where(degenerate, np.nan, np.minimum(corr, 1.0))
+
+
+def _grouped_correlations(
+    numeric_df: pd.DataFrame,
+    target: pd.Series,
+    keys: List[pd.Series],
+) -> pd.DataFrame:
+    """Absolute pairwise-complete correlations per group (groups x features)."""
+    # shifting by the global mean keeps the one-pass moments well conditioned
+    x = (numeric_df - numeric_df.mean()).to_numpy(dtype=float, na_value=np.nan)
+    y = (target - target.mean()).to_numpy(dtype=float, na_value=np.nan)
+    sums = {
+        name: pd.DataFrame(values, index=numeric_df.index, columns=numeric_df.columns)
+        .groupby(keys, dropna=False, sort=True)
+        .sum()
+        for name, values in _row_moments(x, y).items()
+    }
+    corr = _correlations_from_moments({name: frame.to_numpy() for name, frame in sums.items()})
+    return pd.DataFrame(corr, index=sums["n"].index, columns=numeric_df.columns)
+
+
+def _nan_mean(x: np.ndarray) -> np.ndarray:
+    valid = ~np.isnan(x)
+    count = valid.sum(axis=0)
+    return np.asarray(np.where(valid, x, 0.0).sum(axis=0) / np.maximum(count, 1))
+
+
+class CorrelationAccumulator:
+    """
+    Pairwise-complete correlations of ``features`` with ``target``,
+    accumulated over row chunks of a DataFrame.
+    """
+
+    def __init__(self, features: Sequence[str], target: str) -> None:
+        self.features = list(features)
+        self.target = target
+        self.rows = 0
+        self._shift_x: Optional[np.ndarray] = None
+        self._shift_y = 0.0
+        self._sums = {name: np.zeros(len(self.features)) for name in _MOMENTS}
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        x = chunk[self.features].to_numpy(dtype=float, na_value=np.nan)
+        y = chunk[self.target].to_numpy(dtype=float, na_value=np.nan)
+        if self._shift_x is None:
+            # the first chunk's means keep the one-pass moments well conditioned
+            self._shift_x = _nan_mean(x)
+            self._shift_y = float(_nan_mean(y[:, None])[0])
+        for name, values in _row_moments(x - self._shift_x, y - self._shift_y).items():
+            self._sums[name] += values.sum(axis=0)
+        self.rows += len(chunk)
+
+    def correlations(self) -> pd.Series:
+        return pd.Series(_correlations_from_moments(self._sums), index=self.features, dtype=float)
+
+
+def segment_scan(
     df: pd.DataFrame,
+    target_columns: Sequence[str],
+    segment_by: Sequence[str],
+    class_targets: bool = True,
+) -> Tuple[pd.DataFrame, Dict[str, pd.Series], Dict[str, pd.DataFrame]]:
+    """
+    Grouped statistics for every segment of ``df`` in one vectorized pass.
+
+    Returns ``(null_counts, ratios, correlations)``: null counts as a
+    segments x columns frame, per-target class ratios as Series indexed by
+    segment and class (skipped when ``class_targets`` is False), and per-target
+    correlations as segments x features frames. Segment columns themselves
+    are excluded from the checks.
+    """
+    if not isinstance(df, pd.DataFrame):
+        raise TypeError("Segmented checks require a pandas DataFrame")
+
+    segment_by = list(segment_by)
+    keys = [df[col] for col in segment_by]
+    data = df.drop(columns=segment_by)
+
+    null_counts = data.isnull().groupby(keys, dropna=False, sort=True).sum()
+
+    ratios: Dict[str, pd.Series] = {}
+    if class_targets:
+        for target in target_columns:
+            ratios[target] = data[target].groupby(keys, dropna=False, sort=True).value_counts(normalize=True)
+
+    numeric_df = data.select_dtypes(include="number")
+    target_set = set(target_columns)
+    features = [col for col in numeric_df.columns if col not in target_set]
+    correlations: Dict[str, pd.DataFrame] = {}
+    for target in target_columns:
+        if target in numeric_df.columns and features:
+            correlations[target] = _grouped_correlations(numeric_df[features], numeric_df[target], keys)
+
+    return null_counts, ratios, correlations
+
+
+def check_data_leakage(
+    df: Frame,
     target_column: str,
     correlation_threshold: float = 0.95,
+    correlations: Optional[pd.Series] = None,
 ) -> None:
     """
     Detect features overly correlated with target.
+
+    ``correlations`` may be passed to reuse a column of ``target_correlations``.
     """
+    df = as_frame(df)
     if target_column not in df.columns:
         raise ValueError(f"Target column '{target_column}' not found")
 
-    numeric_df = df.select_dtypes(include="number")
-
-    if target_column not in numeric_df.columns:
-        return
-
-    correlations = numeric_df.corr()[target_column].abs()
+    if correlations is None:
+        matrix = target_correlations(df, [target_column])
+        if target_column not in matrix.columns:
+            return
+        correlations = matrix[target_column]
 
     leaked_features = [
         col for col, corr in correlations.items()
@@ -74,4 +396,178 @@ def check_data_leakage(
     ]
 
     if leaked_features:
-        raise DataLeakageError(features=leaked_features)
\ No newline at end of file
+        raise DataLeakageError(features=leaked_features)
+
+
+def _key_hashes(keys: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """uint64 hash per row of the key columns, plus a mask of rows with no null key."""
+    valid = keys.notna().all(axis=1).to_numpy()
+    hashes = pd.util.hash_pandas_object(keys, index=False).to_numpy()
+    return hashes, valid
+
+
+def _is_integral(values: pd.Series) -> bool:
+    if pd.api.types.is_integer_dtype(values):
+        return True
+    v = values.dropna().to_numpy(dtype=float)
+    return bool(np.isfinite(v).all() and (v == np.floor(v)).all() and (np.abs(v) < 2**63).all())
+
+
+def _align_key_dtypes(keys: Dict[Any, pd.DataFrame]) -> Dict[Any, pd.DataFrame]:
+    """
+    Give each numeric key column one dtype across splits.
+
+    ``hash_pandas_object`` hashes the same value differently per dtype, and a
+    single NaN turns an integer id column into float. Numeric columns whose
+    values are all integral become nullable ``Int64`` (hashed like int64),
+    others float64.
+    """
+    key_columns = next(iter(keys.values())).columns if keys else []
+    for col in key_columns:
+        values = [part[col] for part in keys.values()]
+        if len({v.dtype for v in values}) == 1:
+            continue
+        if not all(pd.api.types.is_numeric_dtype(v) and not pd.api.types.is_bool_dtype(v) for v in values):
+            continue
+        dtype = "Int64" if all(_is_integral(v) for v in values) else "float64"
+        for name, part in keys.items():
+            keys[name] = part.assign(**{col: part[col].astype(dtype)})
+    return keys
+
+
+def _key_index(hashes: np.ndarray) -> np.ndarray:
+    """Sorted distinct uint64 hashes (hash-based dedup, then sort the distinct keys only)."""
+    return np.sort(pd.unique(hashes))
+
+
+def group_overlap(
+    df: Optional[pd.DataFrame],
+    group_columns: Sequence[str],
+    split_column: Optional[str] = None,
+    splits: Optional[Mapping[str, pd.DataFrame]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Count entities shared between every pair of splits.
+
+    Splits come from ``split_column`` of ``df`` or from the ``splits`` mapping
+    of separate frames. Each split's key rows are hashed to uint64 and reduced
+    to a sorted index of distinct keys; pairs are joined with
+    ``np.intersect1d``. Rows with a null key are ignored. Returns one dict per
+    pair with the shared ``overlap`` count, each split's ``distinct`` key count
+    and ``rates`` (overlap / distinct keys of that split).
+    """
+    group_columns = list(group_columns)
+    indexes: Dict[Any, np.ndarray] = {}
+
+    if splits is not None:
+        keys = _align_key_dtypes({name: frame[group_columns] for name, frame in splits.items()})
+        for name, part in keys.items():
+            hashes, valid = _key_hashes(part)
+            indexes[name] = _key_index(hashes[valid])
+    else:
+        if df is None or split_column is None:
+            raise ValueError("Pass either df with split_column, or splits")
+        for col in [*group_columns, split_column]:
+            if col not in df.columns:
+                raise ValueError(f"Column '{col}' not found")
+        hashes, valid = _key_hashes(df[group_columns])
+        codes, names = pd.factorize(df[split_column], sort=True)
+        valid = valid & (codes >= 0)
+        for code, name in enumerate(names):
+            indexes[name] = _key_index(hashes[valid & (codes == code)])
+
+    names_list = list(indexes)
+    result = []
+    for i, first in enumerate(names_list):
+        for second in names_list[i + 1:]:
+            overlap = int(np.intersect1d(indexes[first], indexes[second], assume_unique=True).size)
+            sizes = {first: int(indexes[first].size), second: int(indexes[second].size)}
+            result.append(
+                {
+                    "splits": [first, second],
+                    "overlap": overlap,
+                    "distinct": sizes,
+                    "rates": {name: overlap / size if size else 0.0 for name, size in sizes.items()},
+                }
+            )
+    return result
+
+
+def check_group_leakage(
+    df: Optional[pd.DataFrame],
+    group_columns: Sequence[str],
+    split_column: Optional[str] = None,
+    splits: Optional[Mapping[str, pd.DataFrame]] = None,
+    max_overlap_rate: float = 0.0,
+) -> None:
+    """
+    Raise GroupLeakageError if entities are shared between splits.
+
+    A pair of splits fails when its overlap exceeds ``max_overlap_rate`` of
+    the smaller split's distinct keys.
+    """
+    overlaps = group_overlap(df, group_columns, split_column=split_column, splits=splits)
+    leaking = [
+        item for item in overlaps
+        if item["overlap"] and max(item["rates"].values()) > max_overlap_rate
+    ]
+    if leaking:
+        raise GroupLeakageError(group_columns=group_columns, overlaps=leaking)
+
+
+class StreamingScan:
+    """
+    Null counts, class ratios and target correlations accumulated over row
+    chunks, equivalent to ``scan_dataset`` / ``class_ratios`` on the
+    concatenated frame. Column roles are fixed by the first chunk.
+    """
+
+    def __init__(self, target_columns: Sequence[str], count_classes: bool = True) -> None:
+        self.target_columns = list(target_columns)
+        self.count_classes = count_classes
+        self.columns: Optional[pd.Index] = None
+        self.rows = 0
+        self._null_counts = pd.Series([], dtype="int64")
+        self._class_counts: Dict[str, pd.Series] = {}
+        self._accumulators: Dict[str, CorrelationAccumulator] = {}
+        self._features: List[str] = []
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        if self.columns is None:
+            for target in self.target_columns:
+                if target not in chunk.columns:
+                    raise ValueError(f"Target column '{target}' not found")
+            self.columns = chunk.columns
+            numeric = chunk.select_dtypes(include="number").columns
+            target_set = set(self.target_columns)
+            self._features = [col for col in numeric if col not in target_set]
+            self._null_counts = pd.Series(0, index=chunk.columns, dtype="int64")
+            for target in self.target_columns:
+                if self.count_classes:
+                    self._class_counts[target] = pd.Series(dtype="float64")
+                if target in numeric and self._features:
+                    self._accumulators[target] = CorrelationAccumulator(self._features, target)
+
+        self._null_counts = self._null_counts + missing_value_counts(chunk)
+        for target in self._class_counts:
+            self._class_counts[target] = self._class_counts[target].add(chunk[target].value_counts(), fill_value=0)
+        for accumulator in self._accumulators.values():
+            accumulator.update(chunk)
+        self.rows += len(chunk)
+
+    def null_counts(self) -> pd.Series:
+        return self._null_counts
+
+    def correlations(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            {target: accumulator.correlations() for target, accumulator in self._accumulators.items()},
+            index=self._features,
+            dtype=float,
+        )
+
+    def ratios(self) -> Dict[str, pd.Series]:
+        result = {}
+        for target, counts in self._class_counts.items():
+            total = counts.sum()
+            result[target] = (counts / total).sort_values(ascending=False) if total else pd.Series([], dtype=float)
+        return result
@@ -159,3 +159,202 @@ def test_cli_check_writes_output_json(tmp_path):
     with open(report_path) as f:
         data = json.load(f)
     assert "missing_values" in data
+
+
+def test_cli_check_multiple_targets(tmp_path):
+    from click.testing import CliRunner
+    from datasetsanity.cli import main
+
+    csv_path = str(tmp_path / "data.csv")
+    report_path = str(tmp_path / "report.json")
+    df = pd.DataFrame({"feat": [1, 2, 3, 4], "t1": [0, 1, 0, 1], "t2": [1, 1, 0, 0]})
+    df.to_csv(csv_path, index=False)
+
+    runner = CliRunner()
+    result = runner.invoke(main, ["check", csv_path, "--target", "t1", "--target", "t2", "--output", report_path])
+    assert result.exit_code == 0
+    assert "Target: t1" in result.output
+    with open(report_path) as f:
+        data = json.load(f)
+    assert set(data["targets"]) == {"t1", "t2"}
+
+
+def test_cli_check_unknown_column_is_usage_error(tmp_path):
+    from click.testing import CliRunner
+    from datasetsanity.cli import main
+
+    csv_path = str(tmp_path / "data.csv")
+    pd.DataFrame({"feat": [1, 2, 3, 4], "target": [0, 1, 0, 1]}).to_csv(csv_path, index=False)
+
+    runner = CliRunner()
+    result = runner.invoke(main, ["check", csv_path, "--target", "target", "--columns", "feat", "--columns", "nope"])
+    assert result.exit_code == 2
+    assert "Columns not found" in result.output
+    assert "nope" in result.output
+
+
+# ---------------------------------------------------------------------------
+# Server mode
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def running_server():
+    import threading
+    from datasetsanity.server import make_server
+
+    server = make_server("127.0.0.1:0")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address
+    yield f"{host}:{port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_server_report_matches_local_run(tmp_path, running_server):
+    from datasetsanity.client import send_request
+
+    csv_path = str(tmp_path / "data.csv")
+    df = pd.DataFrame({"feat": [1, None, 3, 4], "target": [0, 1, 0, 1], "leak": [0, 1, 0, 1]})
+    df.to_csv(csv_path, index=False)
+
+    expected = DatasetSanity(pd.read_csv(csv_path), target="target").run().to_dict()
+    for _ in range(2):
+        reply = send_request(running_server, {"path": csv_path, "target": "target"}, timeout=30)
+        assert reply["ok"] is True
+        assert reply["report"] == expected
+
+
+def test_server_reports_errors(running_server):
+    from datasetsanity.client import send_request
+
+    reply = send_request(running_server, {"path": "/does/not/exist.csv", "target": "target"}, timeout=30)
+    assert reply["ok"] is False
+    assert "FileNotFoundError" in reply["error"]
+
+
+def test_cli_check_via_server(tmp_path, running_server):
+    from click.testing import CliRunner
+    from datasetsanity.cli import main
+
+    csv_path = str(tmp_path / "data.csv")
+    df = pd.DataFrame({"feat": [1, None, 3], "target": [0, 1, 0]})
+    df.to_csv(csv_path, index=False)
+
+    runner = CliRunner()
+    result = runner.invoke(main, ["check", csv_path, "--target", "target", "--server", running_server])
+    assert result.exit_code == 1
+    assert "FAILED" in result.output
+
+
+def test_cli_check_reports_unreachable_server(tmp_path):
+    import socket
+    from click.testing import CliRunner
+    from datasetsanity.cli import main
+
+    csv_path = str(tmp_path / "data.csv")
+    pd.DataFrame({"feat": [1, 2], "target": [0, 1]}).to_csv(csv_path, index=False)
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        free_port = probe.getsockname()[1]
+
+    runner = CliRunner()
+    for address in (f"127.0.0.1:{free_port}", str(tmp_path / "missing.sock")):
+        result = runner.invoke(main, ["check", csv_path, "--target", "target", "--server", address])
+        assert result.exit_code == 1
+        assert "cannot reach server" in result.output
+
+
+# ---------------------------------------------------------------------------
+# Async API
+# ---------------------------------------------------------------------------
+
+def _write_csvs(tmp_path):
+    frames = {
+        "clean.csv": pd.DataFrame({"feat": [3, 1, 4, 1, 5, 9, 2, 6], "target": [0, 1, 0, 1, 1, 0, 0, 1]}),
+        "missing.csv": pd.DataFrame({"feat": [1, 2, None, 4, 5, 6, 7, 8], "target": [0, 1, 0, 1, 0, 1, 0, 1]}),
+        "leak.csv": pd.DataFrame({"leak": [0, 1, 0, 1, 1, 0, 1, 0], "target": [0, 1, 0, 1, 1, 0, 1, 0]}),
+    }
+    paths = []
+    for name, df in frames.items():
+        path = str(tmp_path / name)
+        df.to_csv(path, index=False)
+        paths.append(path)
+    return paths
+
+
+def test_arun_matches_run():
+    import asyncio
+
+    df = pd.DataFrame({"target": [0, 1, 0, 1], "leak": [0, 1, 0, 1]})
+    checker = DatasetSanity(df, target="target")
+    assert asyncio.run(checker.arun()).to_dict() == checker.run().to_dict()
+
+
+def test_acheck_csv_streams_chunks_like_sync_path(tmp_path):
+    import asyncio
+    from datasetsanity.aio import acheck_csv
+
+    for path in _write_csvs(tmp_path):
+        expected = DatasetSanity(pd.read_csv(path), target="target").run().to_dict()
+        report = asyncio.run(acheck_csv(path, "target", chunk_rows=3))
+        assert report.to_dict() == expected
+
+
+def test_acheck_many_limits_in_flight(tmp_path):
+    import asyncio
+    from datasetsanity.aio import acheck_many
+
+    paths = _write_csvs(tmp_path)
+    frame = pd.DataFrame({"feat": [1, 2, 3, 4], "target": [0, 1, 0, 1]})
+    reports = asyncio.run(acheck_many(paths + [frame, paths[1]], target="target", max_in_flight=1, chunk_rows=3))
+    assert len(reports) == 5
+    assert reports[1].missing_values.passed is False
+    assert reports[2].leakage.passed is False
+    assert reports[3].passed is True
+    assert reports[4].to_dict() == reports[1].to_dict()
+    with pytest.raises(TypeError):
+        asyncio.run(acheck_many(paths, target="target", segment_by="feat"))
+
+
+def test_cli_check_group_leakage(tmp_path):
+    from click.testing import CliRunner
+    from datasetsanity.cli import main
+
+    csv_path = str(tmp_path / "data.csv")
+    df = pd.DataFrame(
+        {
+            "user": [1, 2, 3, 4, 1, 5],
+            "split": ["train"] * 4 + ["test"] * 2,
+            "target": [0, 1, 0, 1, 0, 1],
+        }
+    )
+    df.to_csv(csv_path, index=False)
+
+    runner = CliRunner()
+    args = ["check", csv_path, "--target", "target", "--group-by", "user", "--split-column", "split"]
+    result = runner.invoke(main, args)
+    assert result.exit_code == 1
+    assert "Group Leakage: FAILED" in result.output
+    assert runner.invoke(main, args[:-2]).exit_code == 2
+
+
+def test_cli_check_reports_parse_stats_and_columns(tmp_path):
+    from click.testing import CliRunner
+    from datasetsanity.cli import main
+
+    csv_path = str(tmp_path / "data.csv")
+    report_path = str(tmp_path / "report.json")
+    df = pd.DataFrame({"feat": [1, 2, 3, 4], "broken": [1, None, 3, 4], "target": [0, 1, 0, 1]})
+    df.to_csv(csv_path, index=False)
+
+    runner = CliRunner()
+    result = runner.invoke(main, ["check", csv_path, "--target", "target"])
+    assert result.exit_code == 1
+    assert "Parsed 4 rows x 3 columns" in result.output
+    assert "saved vs default read" in result.output
+
+    args = ["check", csv_path, "--target", "target", "--columns", "feat", "--output", report_path]
+    assert runner.invoke(main, args).exit_code == 0
+    assert runner.invoke(main, ["check", csv_path, "--target", "target", "--columns", "nope"]).exit_code == 2
+    assert runner.invoke(main, ["check", csv_path, "--target", "target", "--columns", "feat", "--server", "x:1"]).exit_code == 2
@@ -195,3 +195,633 @@ def test_dataset_sanity_run_records_leakage_failure():
     report = checker.run()
     assert report.leakage.passed is False
 
+
+
+# ---------------------------------------------------------------------------
+# Multi-target runs
+# ---------------------------------------------------------------------------
+
+def test_target_correlations_matches_pandas_corr():
+    from datasetsanity.validators import target_correlations
+
+    df = pd.DataFrame(
+        {
+            "a": [1.0, 2.0, 3.0, 4.0, 5.0],
+            "b": [2.0, 1.0, 4.0, 3.0, 6.0],
+            "t1": [0, 1, 0, 1, 1],
+            "t2": [5.0, 3.0, 1.0, 2.0, 0.0],
+        }
+    )
+    result = target_correlations(df, ["t1", "t2"])
+    expected = df.corr().abs().loc[["a", "b"], ["t1", "t2"]]
+    assert list(result.index) == ["a", "b"]
+    assert list(result.columns) == ["t1", "t2"]
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_target_correlations_constant_feature_is_nan():
+    from datasetsanity.validators import target_correlations
+
+    df = pd.DataFrame({"const": [1, 1, 1, 1], "t": [0, 1, 0, 1]})
+    assert target_correlations(df, ["t"])["t"].isna().all()
+
+
+def test_dataset_sanity_multi_target_sections():
+    df = pd.DataFrame(
+        {
+            "feat": [1, 2, 3, 4],
+            "t_ok": [0, 1, 1, 0],
+            "t_leak": [0, 1, 0, 1],
+            "leak": [0, 1, 0, 1],
+        }
+    )
+    report = DatasetSanity(df, target=["t_ok", "t_leak"]).run()
+    assert set(report.targets) == {"t_ok", "t_leak"}
+    assert report.targets["t_leak"].leakage.passed is False
+    assert report.targets["t_leak"].leakage.details["leaked_features"] == ["leak"]
+    assert report.leakage.passed is False
+    assert report.leakage.details["failed_targets"] == ["t_leak"]
+    assert report.passed is False
+
+
+def test_dataset_sanity_multi_target_excludes_other_targets_from_features():
+    df = pd.DataFrame({"feat": [1, 2, 3, 4], "t1": [0, 1, 0, 1], "t2": [0, 1, 0, 1]})
+    report = DatasetSanity(df, target=["t1", "t2"]).run()
+    assert report.leakage.passed is True
+
+
+@pytest.mark.parametrize("target", [[], ["t1", "t1"]])
+def test_dataset_sanity_rejects_empty_or_duplicate_targets(target):
+    df = pd.DataFrame({"feat": [1, 2, 3, 4], "t1": [0, 1, 0, 1]})
+    with pytest.raises(ValueError):
+        DatasetSanity(df, target=target)
+
+
+def test_dataset_sanity_single_target_has_no_sections():
+    df = pd.DataFrame({"feat": [1, 2, 3, 4], "target": [0, 1, 0, 1]})
+    assert DatasetSanity(df, target="target").run().targets is None
+
+
+# ---------------------------------------------------------------------------
+# Sparse inputs
+# ---------------------------------------------------------------------------
+
+def _sparse_frame(fill_value):
+    import numpy as np
+
+    data = {
+        "a": [0.0, 0.0, 1.0, 2.0, 0.0, 3.0],
+        "b": [0.0, np.nan, 0.0, 1.0, 0.0, 0.0],
+    }
+    df = pd.DataFrame({col: pd.arrays.SparseArray(values, fill_value=fill_value) for col, values in data.items()})
+    df["target"] = [0.0, 0.0, 1.0, 1.0, 0.0, 1.0]
+    return df, pd.DataFrame(data).assign(target=df["target"])
+
+
+@pytest.mark.parametrize("fill_value", [0.0, float("nan")])
+def test_missing_value_counts_sparse_matches_dense(fill_value):
+    from datasetsanity.validators import missing_value_counts
+
+    sparse_df, dense_df = _sparse_frame(fill_value)
+    assert missing_value_counts(sparse_df).to_dict() == missing_value_counts(dense_df).to_dict()
+
+
+@pytest.mark.parametrize("fill_value", [0.0, float("nan")])
+def test_target_correlations_sparse_matches_dense(fill_value):
+    from datasetsanity.validators import target_correlations
+
+    sparse_df, dense_df = _sparse_frame(fill_value)
+    pd.testing.assert_frame_equal(
+        target_correlations(sparse_df, ["target"]),
+        target_correlations(dense_df, ["target"]),
+    )
+
+
+def test_dataset_sanity_accepts_scipy_sparse():
+    sp = pytest.importorskip("scipy.sparse")
+
+    matrix = sp.csr_matrix([[0, 1, 0], [1, 0, 1], [0, 0, 0], [1, 0, 1]])
+    report = DatasetSanity(matrix, target="label", columns=["leak", "feat", "label"]).run()
+    assert report.missing_values.passed is True
+    assert report.leakage.details["leaked_features"] == ["leak"]
+
+
+def test_from_scipy_sparse_keeps_zero_fill():
+    sp = pytest.importorskip("scipy.sparse")
+    from datasetsanity.sparse import from_scipy_sparse
+
+    df = from_scipy_sparse(sp.csr_matrix([[0.0, 1.0], [2.0, 0.0]]), columns=["x", "y"])
+    assert df["x"].dtype == pd.SparseDtype("float64", 0)
+    assert df["x"].array.sp_values.tolist() == [2.0]
+    assert df.sparse.to_dense()["y"].tolist() == [1.0, 0.0]
+
+
+# ---------------------------------------------------------------------------
+# Arrow / Polars inputs
+# ---------------------------------------------------------------------------
+
+def _arrow_source_df():
+    return pd.DataFrame(
+        {
+            "feat": [1.0, 2.0, None, 4.0, 5.0, 6.0],
+            "name": ["a", "b", "c", None, "e", "f"],
+            "leak": [0, 1, 0, 1, 1, 0],
+            "target": [0, 1, 0, 1, 1, 0],
+        }
+    )
+
+
+def test_arrow_frame_matches_pandas_checks():
+    pa = pytest.importorskip("pyarrow")
+    from datasetsanity.validators import missing_value_counts, target_correlations
+
+    df = _arrow_source_df()
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    assert missing_value_counts(table).to_dict() == missing_value_counts(df).to_dict()
+    pd.testing.assert_frame_equal(target_correlations(table, ["target"]), target_correlations(df, ["target"]))
+
+
+def test_arrow_frame_counts_nan_as_missing():
+    pa = pytest.importorskip("pyarrow")
+    from datasetsanity.validators import missing_value_counts
+
+    table = pa.table({"x": [1.0, float("nan"), None], "y": [1, 2, 3]})
+    assert missing_value_counts(table).to_dict() == {"x": 2, "y": 0}
+
+
+def test_arrow_frame_numeric_column_is_zero_copy():
+    pa = pytest.importorskip("pyarrow")
+    from datasetsanity.adapters import ArrowFrame
+
+    table = pa.table({"x": [1.0, 2.0, 3.0]})
+    values = ArrowFrame(table).to_numpy("x")
+    assert not values.flags.owndata
+
+
+@pytest.mark.parametrize("backend", ["pyarrow", "polars"])
+def test_dataset_sanity_report_matches_pandas(backend):
+    df = _arrow_source_df()
+    if backend == "pyarrow":
+        pa = pytest.importorskip("pyarrow")
+        data = pa.Table.from_pandas(df, preserve_index=False)
+    else:
+        pl = pytest.importorskip("polars")
+        pytest.importorskip("pyarrow")
+        data = pl.from_pandas(df)
+
+    expected = DatasetSanity(df, target="target").run().to_dict()
+    assert DatasetSanity(data, target="target").run().to_dict() == expected
+
+
+# ---------------------------------------------------------------------------
+# Accelerated kernels
+# ---------------------------------------------------------------------------
+
+def _kernel_inputs(with_nan):
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(500, 6))
+    x[:, 5] = 1.0  # constant column
+    y = np.column_stack([x[:, 0] * 2 + rng.normal(size=500) * 0.01, rng.integers(0, 3, 500)])
+    if with_nan:
+        x[rng.random(x.shape) < 0.05] = np.nan
+        y[::37, 1] = np.nan
+    return x, y
+
+
+@pytest.mark.parametrize("with_nan", [False, True])
+def test_numpy_column_scan_matches_pandas(with_nan):
+    import numpy as np
+    from datasetsanity.kernels import _numpy_column_scan
+
+    x, y = _kernel_inputs(with_nan)
+    null_counts, corr = _numpy_column_scan(x, y)
+    frame = pd.DataFrame(x)
+    assert null_counts.tolist() == frame.isnull().sum().tolist()
+    expected = np.column_stack([frame.corrwith(pd.Series(y[:, j])).abs() for j in range(y.shape[1])])
+    np.testing.assert_allclose(corr, expected)
+
+
+@pytest.mark.parametrize("with_nan", [False, True])
+def test_numba_column_scan_matches_numpy(with_nan):
+    pytest.importorskip("numba")
+    import numpy as np
+    from datasetsanity.kernels import _numba_column_scan, _numpy_column_scan
+
+    x, y = _kernel_inputs(with_nan)
+    expected_counts, expected_corr = _numpy_column_scan(x, y)
+    null_counts, corr = _numba_column_scan(np.asfortranarray(x), y)
+    assert null_counts.tolist() == expected_counts.tolist()
+    np.testing.assert_allclose(corr, expected_corr, rtol=1e-10)
+
+
+def test_column_scan_uses_numpy_below_jit_threshold(monkeypatch):
+    from datasetsanity import kernels
+
+    def fail(*args):
+        raise AssertionError("compiled kernel used for a small block")
+
+    monkeypatch.setattr(kernels, "_numba_column_scan", fail, raising=False)
+    import numpy as np
+
+    x, y = _kernel_inputs(True)
+    null_counts, corr = kernels.column_scan(x, y)
+    expected_counts, expected_corr = kernels._numpy_column_scan(x, y)
+    assert null_counts.tolist() == expected_counts.tolist()
+    np.testing.assert_allclose(corr, expected_corr)
+
+
+def test_column_scan_falls_back_when_numba_is_broken(monkeypatch):
+    import numpy as np
+    from datasetsanity import kernels
+
+    def broken(*args):
+        raise ImportError("numba/numpy version mismatch")
+
+    monkeypatch.setattr(kernels, "HAS_NUMBA", True)
+    monkeypatch.setattr(kernels, "JIT_MIN_SIZE", 1)
+    monkeypatch.setattr(kernels, "_numba_column_scan", broken)
+    x, y = _kernel_inputs(True)
+    null_counts, corr = kernels.column_scan(x, y)
+    np.testing.assert_allclose(corr, kernels._numpy_column_scan(x, y)[1])
+    assert kernels.HAS_NUMBA is False
+
+
+def test_column_scan_empty_block_has_no_warnings():
+    import warnings
+    import numpy as np
+    from datasetsanity.kernels import column_scan
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        null_counts, corr = column_scan(np.empty((0, 3)), np.empty((0, 1)))
+    assert null_counts.tolist() == [0, 0, 0]
+    assert np.isnan(corr).all()
+
+
+def test_class_ratios_matches_value_counts():
+    from datasetsanity.validators import class_ratios
+
+    df = pd.DataFrame({"label": ["a", "b", "a", None, "c", "a"]})
+    expected = df["label"].value_counts(normalize=True)
+    assert class_ratios(df, "label").to_dict() == expected.to_dict()
+
+
+# ---------------------------------------------------------------------------
+# Server dataset cache
+# ---------------------------------------------------------------------------
+
+def test_dataset_cache_reuses_and_evicts(tmp_path):
+    from datasetsanity.server import DatasetCache
+
+    paths = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / f"{name}.csv"
+        pd.DataFrame({"feat": [1, 2], "target": [0, 1]}).to_csv(path, index=False)
+        paths.append(str(path))
+
+    cache = DatasetCache(max_datasets=2)
+    first = cache.load(paths[0])
+    assert cache.load(paths[0]) is first
+    cache.load(paths[1])
+    cache.load(paths[2])
+    assert len(cache) == 2
+    assert cache.load(paths[0]) is not first
+    assert cache.hits == 1
+
+
+def test_dataset_cache_reloads_modified_file(tmp_path):
+    from datasetsanity.server import DatasetCache
+
+    path = tmp_path / "data.csv"
+    pd.DataFrame({"feat": [1, 2], "target": [0, 1]}).to_csv(path, index=False)
+    cache = DatasetCache()
+    assert len(cache.load(str(path))) == 2
+
+    pd.DataFrame({"feat": [1, 2, 3], "target": [0, 1, 0]}).to_csv(path, index=False)
+    assert len(cache.load(str(path))) == 3
+    assert len(cache) == 1
+
+
+def test_dataset_cache_cold_load_does_not_block_other_files(tmp_path, monkeypatch):
+    import threading
+    from datasetsanity import server
+
+    slow, fast = str(tmp_path / "slow.csv"), str(tmp_path / "fast.csv")
+    for path in (slow, fast):
+        pd.DataFrame({"feat": [1, 2], "target": [0, 1]}).to_csv(path, index=False)
+    cache = server.DatasetCache()
+    cache.load(fast)
+
+    started, release = threading.Event(), threading.Event()
+    read_csv = pd.read_csv
+
+    def blocking_read(path, *args, **kwargs):
+        if path.endswith("slow.csv"):
+            started.set()
+            release.wait(5)
+        return read_csv(path, *args, **kwargs)
+
+    monkeypatch.setattr(server.pd, "read_csv", blocking_read)
+    loader = threading.Thread(target=cache.load, args=(slow,))
+    loader.start()
+    try:
+        assert started.wait(5)
+        done = threading.Event()
+        threading.Thread(target=lambda: (cache.check(fast, target="target"), done.set())).start()
+        assert done.wait(5), "cache hit on another file waited for a cold load"
+    finally:
+        release.set()
+        loader.join()
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_parse_address():
+    import socket
+    from datasetsanity.client import parse_address
+
+    assert parse_address("127.0.0.1:9000") == (socket.AF_INET, ("127.0.0.1", 9000))
+    if hasattr(socket, "AF_UNIX"):
+        assert parse_address("/tmp/ds.sock") == (socket.AF_UNIX, "/tmp/ds.sock")
+    with pytest.raises(ValueError):
+        parse_address("localhost")
+
+
+def test_make_server_refuses_to_replace_regular_file(tmp_path):
+    import socket
+    from datasetsanity.server import make_server
+
+    if not hasattr(socket, "AF_UNIX"):
+        pytest.skip("Unix sockets not supported")
+    path = tmp_path / "precious.csv"
+    path.write_text("a,b\n1,2\n")
+    with pytest.raises(FileExistsError):
+        make_server(str(path))
+    assert path.read_text() == "a,b\n1,2\n"
+
+
+# ---------------------------------------------------------------------------
+# Segmented checks
+# ---------------------------------------------------------------------------
+
+def _segmented_df():
+    return pd.DataFrame(
+        {
+            "region": ["eu"] * 4 + ["us"] * 4 + ["ap"] * 4,
+            "feat": [1.0, 2.0, 3.0, 4.0, 1.0, None, 3.0, 4.0, 4.0, 1.0, 2.0, 3.0],
+            "leak": [0, 1, 0, 1, 5, 2, 7, 1, 3, 1, 4, 1],
+            "target": [0, 1, 0, 1, 0, 1, 1, 0, 1, 1, 1, 1],
+        }
+    )
+
+
+def test_segmented_run_matches_per_segment_runs():
+    df = _segmented_df()
+    report = DatasetSanity(df, target="target", segment_by="region").run()
+    assert set(report.segments) == {("eu",), ("us",), ("ap",)}
+    for (region,), segment in report.segments.items():
+        part = df[df["region"] == region].drop(columns="region")
+        assert segment.to_dict() == DatasetSanity(part, target="target").run().to_dict()
+
+
+@pytest.mark.parametrize(
+    "target, task",
+    [(["target", "leak"], "classification"), ("target", "regression"), (["target", "leak"], "regression")],
+)
+def test_segmented_verdicts_match_per_segment_runs(target, task):
+    df = _segmented_df()
+    report = DatasetSanity(df, target=target, task=task, correlation_threshold=0.5, segment_by="region").run()
+    for (region,), segment in report.segments.items():
+        part = df[df["region"] == region].drop(columns="region")
+        expected = DatasetSanity(part, target=target, task=task, correlation_threshold=0.5).run()
+        assert segment.to_dict() == expected.to_dict()
+
+
+def test_segmented_run_flags_failing_segments():
+    report = DatasetSanity(_segmented_df(), target="target", segment_by=["region"]).run()
+    table = report.segment_table().set_index("region")
+    assert table.loc["eu", "leaked_features"] == ["leak"]
+    assert table.loc["us", "affected_columns"] == ["feat"]
+    assert table.loc["ap", "class_imbalance"] == False  # noqa: E712
+    assert report.passed is False
+
+
+def test_segmented_report_to_json(tmp_path):
+    report = DatasetSanity(_segmented_df(), target="target", segment_by="region").run()
+    path = str(tmp_path / "report.json")
+    report.to_json(path)
+    with open(path) as f:
+        data = json.load(f)
+    assert data["segment_by"] == ["region"]
+    assert sorted(entry["segment"][0] for entry in data["segments"]) == ["ap", "eu", "us"]
+    assert SanityReport.from_dict(data).to_dict() == data
+
+
+# ---------------------------------------------------------------------------
+# Fail-fast and deadline modes
+# ---------------------------------------------------------------------------
+
+def _long_df(rows=1000):
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({"a": rng.normal(size=rows), "b": rng.normal(size=rows), "target": rng.integers(0, 2, rows)})
+
+
+def test_fail_fast_matches_full_run_on_clean_data():
+    df = _long_df()
+    full = DatasetSanity(df, target="target").run().to_dict()
+    assert DatasetSanity(df, target="target").run(fail_fast=True, chunk_rows=100).to_dict() == full
+
+
+def test_fail_fast_stops_at_first_missing_value():
+    df = _long_df()
+    df.loc[150, "a"] = None
+    report = DatasetSanity(df, target="target").run(fail_fast=True, chunk_rows=100)
+    assert report.missing_values.passed is False
+    assert report.missing_values.status == "completed"
+    assert report.missing_values.details["rows_scanned"] == 200
+    assert report.class_imbalance.status == "not_reached"
+    assert report.leakage.status == "not_reached"
+    assert report.passed is False
+
+
+def test_fail_fast_certain_class_imbalance():
+    df = pd.DataFrame({"feat": range(1000), "target": [1] * 950 + [0] * 50})
+    report = DatasetSanity(df, target="target").run(fail_fast=True, chunk_rows=100)
+    assert report.class_imbalance.passed is False
+    assert report.class_imbalance.status == "completed"
+    assert report.leakage.status == "not_reached"
+
+
+def test_zero_deadline_reaches_nothing(capsys):
+    report = DatasetSanity(_long_df(), target="target").run(deadline=0)
+    assert report.missing_values.status == "not_reached"
+    assert report.passed is False
+    report.summary()
+    assert "NOT REACHED" in capsys.readouterr().out
+
+
+def test_correlation_accumulator_matches_single_pass():
+    import numpy as np
+    from datasetsanity.validators import CorrelationAccumulator, target_correlations
+
+    df = _long_df()
+    df.loc[::7, "b"] = None
+    accumulator = CorrelationAccumulator(["a", "b"], "target")
+    for start in range(0, len(df), 128):
+        accumulator.update(df.iloc[start : start + 128])
+    expected = target_correlations(df, ["target"])["target"]
+    np.testing.assert_allclose(accumulator.correlations().to_numpy(), expected.to_numpy())
+
+
+# ---------------------------------------------------------------------------
+# Group leakage across splits
+# ---------------------------------------------------------------------------
+
+def _split_df():
+    return pd.DataFrame(
+        {
+            "customer": [1, 2, 3, 4, 5, 6, 3, 7, None],
+            "store": ["a", "a", "b", "b", "a", "b", "b", "a", "a"],
+            "split": ["train", "train", "train", "train", "test", "test", "test", "val", "val"],
+            "target": [0, 1, 0, 1, 0, 1, 0, 1, 0],
+        }
+    )
+
+
+def test_group_overlap_counts_shared_keys():
+    from datasetsanity.validators import group_overlap
+
+    overlaps = {tuple(item["splits"]): item for item in group_overlap(_split_df(), ["customer"], "split")}
+    assert overlaps[("test", "train")]["overlap"] == 1
+    assert overlaps[("test", "train")]["distinct"] == {"test": 3, "train": 4}
+    assert overlaps[("test", "train")]["rates"]["train"] == pytest.approx(0.25)
+    assert overlaps[("test", "val")]["overlap"] == 0
+    assert overlaps[("train", "val")]["overlap"] == 0
+
+
+def test_group_overlap_composite_key_and_split_frames():
+    from datasetsanity.validators import group_overlap
+
+    df = _split_df()
+    splits = {name: frame for name, frame in df.groupby("split")}
+    [item] = [
+        item for item in group_overlap(None, ["customer", "store"], splits=splits) if item["splits"] == ["test", "train"]
+    ]
+    assert item["overlap"] == 1
+    df.loc[6, "store"] = "a"
+    assert group_overlap(df, ["customer", "store"], "split")[1]["overlap"] == 0
+
+
+def test_check_group_leakage_raises_and_respects_rate():
+    from datasetsanity.custom_exception import GroupLeakageError
+    from datasetsanity.validators import check_group_leakage
+
+    with pytest.raises(GroupLeakageError) as info:
+        check_group_leakage(_split_df(), ["customer"], split_column="split")
+    assert info.value.group_columns == ("customer",)
+    assert info.value.overlaps[0]["splits"] == ["test", "train"]
+    assert "test/train (1 shared)" in str(info.value)
+    check_group_leakage(_split_df(), ["customer"], split_column="split", max_overlap_rate=0.5)
+
+
+def test_dataset_sanity_group_leakage_in_report():
+    df = _split_df().dropna()
+    report = DatasetSanity(df, target="target", group_by="customer", split_column="split").run()
+    assert report.group_leakage.passed is False
+    assert report.group_leakage.details["overlaps"][0]["overlap"] == 1
+    assert report.passed is False
+    data = report.to_dict()
+    assert SanityReport.from_dict(data).to_dict() == data
+    assert "group_leakage" not in DatasetSanity(df, target="target").run().to_dict()
+    with pytest.raises(ValueError):
+        DatasetSanity(df, target="target", group_by="customer")
+
+
+# ---------------------------------------------------------------------------
+# Schema-aware CSV ingestion
+# ---------------------------------------------------------------------------
+
+def test_infer_schema_categorises_low_cardinality_strings():
+    from datasetsanity.ingest import infer_schema
+
+    sample = pd.DataFrame({"num": [1, 2, 3, 4], "few": ["a", "b", "a", "a"], "ids": ["w", "x", "y", "z"]})
+    assert infer_schema(sample) == {"few": "category"}
+    assert infer_schema(sample, keep_dtypes=["few"]) == {}
+
+
+def test_read_csv_fast_usecols_and_downcast(tmp_path):
+    from datasetsanity.ingest import read_csv_fast
+
+    path = str(tmp_path / "data.csv")
+    df = pd.DataFrame({"small": [1, 2, 3] * 10, "big": [2**40, 0, 1] * 10, "kind": ["a", "b", "a"] * 10, "skip": range(30)})
+    df.loc[20, "small"] = 300
+    df.to_csv(path, index=False)
+
+    fast, stats = read_csv_fast(path, usecols=["small", "big", "kind"], sample_rows=6)
+    assert list(fast.columns) == ["small", "big", "kind"]
+    assert str(fast["small"].dtype) == "int16"  # 300 lies outside the sample
+    assert str(fast["big"].dtype) == "int64"
+    assert str(fast["kind"].dtype) == "category"
+    pd.testing.assert_frame_equal(fast.astype({"small": "int64", "kind": object}), df[["small", "big", "kind"]].astype({"kind": object}))
+    assert stats["rows"] == 30 and stats["columns"] == 3
+    assert stats["bytes"] < stats["default_bytes"]
+    with pytest.raises(ValueError):
+        read_csv_fast(path, usecols=["missing"])
+
+
+def test_read_csv_fast_integer_column_with_nulls_next_to_category(tmp_path):
+    from datasetsanity.ingest import read_csv_fast
+
+    path = str(tmp_path / "data.csv")
+    rows = [f"{i},{'ab'[i % 2]},{i % 2}" for i in range(20)] + [",a,1"]
+    with open(path, "w") as f:
+        f.write("\n".join(["count,kind,target", *rows]) + "\n")
+
+    fast, _ = read_csv_fast(path)
+    assert str(fast["kind"].dtype) == "category"
+    assert fast["count"].isna().sum() == 1
+    plain = pd.read_csv(path)
+    assert DatasetSanity(fast, target="target").run().to_dict() == DatasetSanity(plain, target="target").run().to_dict()
+
+
+def test_group_overlap_matches_int_and_float_keys_across_split_frames():
+    import numpy as np
+    from datasetsanity.validators import group_overlap
+
+    train = pd.DataFrame({"id": [1, 2, 3]})
+    test = pd.DataFrame({"id": [1.0, np.nan, 5.0]})
+    assert group_overlap(None, ["id"], splits={"train": train, "test": test})[0]["overlap"] == 1
+    test = pd.DataFrame({"id": [1.0, 2.5]})
+    assert group_overlap(None, ["id"], splits={"train": train, "test": test})[0]["overlap"] == 1
+    small = pd.DataFrame({"id": np.array([1, -1], dtype="int8")})
+    assert group_overlap(None, ["id"], splits={"train": pd.DataFrame({"id": [-1]}), "test": small})[0]["overlap"] == 1
+
+
+def test_segmented_run_handles_nan_segment_key():
+    import numpy as np
+
+    df = pd.DataFrame({"day": [1.0] * 4 + [np.nan] * 4, "feat": np.arange(8.0), "target": [0, 1, 0, 1, 1, 1, 1, 1]})
+    report = DatasetSanity(df, target="target", segment_by="day").run()
+    [nan_key] = [key for key in report.segments if key[0] != key[0]]
+    assert report.segments[nan_key].class_imbalance.passed is False
+    assert report.segments[nan_key].class_imbalance.details["imbalance_ratio"] == 1.0
+    assert report.segments[(1.0,)].class_imbalance.passed is True
+
+
+def test_segment_by_target_column_is_rejected():
+    with pytest.raises(ValueError):
+        DatasetSanity(_segmented_df(), target="target", segment_by=["region", "target"])
+
+
+def test_server_client_path_does_not_set_up_logging():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys; import datasetsanity.cli, datasetsanity.client, datasetsanity.report; "
+        "assert 'datasetsanity.logger' not in sys.modules; assert 'pandas' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)